@@ -0,0 +1,14 @@
+"""
+Event loop setup shared by the standalone MergerTracker scripts
+"""
+
+
+def install_uvloop() -> bool:
+    """Make asyncio.run() use the libuv event loop when uvloop is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    uvloop.install()
+    return True
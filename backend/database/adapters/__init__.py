@@ -5,6 +5,8 @@ This module provides a flexible database abstraction layer that supports
 multiple database backends (PostgreSQL/TimescaleDB, Supabase, Firebase).
 """
 
+import importlib
+
 from .base import (
     DatabaseAdapter, 
     DatabaseConfig, 
@@ -14,8 +16,19 @@ from .base import (
     NotFoundError, 
     DuplicateError
 )
-from .postgresql_adapter import PostgreSQLAdapter
-from .supabase_adapter import SupabaseAdapter
+
+# Concrete adapters are imported on first access so their drivers load only when used
+_LAZY_ADAPTERS = {
+    'PostgreSQLAdapter': '.postgresql_adapter',
+    'SupabaseAdapter': '.supabase_adapter',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ADAPTERS:
+        return getattr(importlib.import_module(_LAZY_ADAPTERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'DatabaseAdapter',
@@ -7,6 +7,15 @@ from pydantic import BaseModel
 class DatabaseAdapter(ABC):
     """Abstract base class for database adapters"""
     
+    # Adapter classes keyed by adapter type, filled in as subclasses are defined
+    _registry: Dict[str, type] = {}
+    
+    def __init_subclass__(cls, adapter_types: tuple = (), **kwargs):
+        """Register the subclass under each adapter type it declares"""
+        super().__init_subclass__(**kwargs)
+        for adapter_type in adapter_types:
+            DatabaseAdapter._registry[adapter_type] = cls
+    
     def __init__(self, connection_config: Dict[str, Any]):
         self.connection_config = connection_config
         self.connection = None
@@ -170,8 +179,8 @@ class DatabaseAdapter(ABC):
         pass
     
     @abstractmethod
-    async def get_database_stats(self) -> Dict[str, Any]:
-        """Get database statistics and health metrics"""
+    async def get_database_stats(self, include_health: bool = False) -> Dict[str, Any]:
+        """Get database statistics, plus connection health when include_health is set"""
         pass
 
 
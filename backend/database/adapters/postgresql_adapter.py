@@ -1,7 +1,10 @@
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+import asyncpg
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import text, select, insert, update, delete, func, and_, or_
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -11,17 +14,150 @@ from .base import DatabaseAdapter, DatabaseError, ConnectionError, ValidationErr
 
 logger = logging.getLogger(__name__)
 
+PG_SERVICE_NAME = 'mergertracker_backup'
+DEFAULT_SOCKET_DIR = '/var/run/postgresql'
 
-class PostgreSQLAdapter(DatabaseAdapter):
+STATS_TABLES = ['deals', 'companies', 'news_articles']
+
+# Static statements are built once so every call reuses the same TextClause
+_PING_QUERY = text("SELECT 1")
+
+_GET_DEAL_QUERY = text("""
+    SELECT d.*, 
+           t.company_name as target_name,
+           a.company_name as acquirer_name
+    FROM deals d
+    LEFT JOIN companies t ON d.target_company = t.company_id
+    LEFT JOIN companies a ON d.acquirer_company = a.company_id
+    WHERE d.deal_id = :deal_id
+""")
+
+_UPDATE_DEAL_QUERY = text("""
+    UPDATE deals 
+    SET deal_status = COALESCE(:deal_status, deal_status),
+        deal_value = COALESCE(:deal_value, deal_value),
+        deal_value_currency = COALESCE(:deal_value_currency, deal_value_currency),
+        expected_completion_date = COALESCE(:expected_completion_date, expected_completion_date),
+        actual_completion_date = COALESCE(:actual_completion_date, actual_completion_date),
+        last_updated = :last_updated
+    WHERE deal_id = :deal_id
+""")
+
+_DELETE_DEAL_QUERY = text("DELETE FROM deals WHERE deal_id = :deal_id")
+
+_GET_COMPANY_QUERY = text("SELECT * FROM companies WHERE company_id = :company_id")
+
+_DELETE_COMPANY_QUERY = text("DELETE FROM companies WHERE company_id = :company_id")
+
+_GET_ARTICLE_QUERY = text("SELECT * FROM news_articles WHERE url = :article_id OR id = :article_id")
+
+_SEARCH_DEALS_QUERY = text("""
+    SELECT d.*, 
+           t.company_name as target_name,
+           a.company_name as acquirer_name,
+           ts_rank(to_tsvector('english', 
+               COALESCE(d.target_company, '') || ' ' || 
+               COALESCE(d.acquirer_company, '') || ' ' ||
+               COALESCE(d.industry_sector, '')
+           ), plainto_tsquery('english', :query)) as rank
+    FROM deals d
+    LEFT JOIN companies t ON d.target_company = t.company_id
+    LEFT JOIN companies a ON d.acquirer_company = a.company_id
+    WHERE to_tsvector('english', 
+        COALESCE(d.target_company, '') || ' ' || 
+        COALESCE(d.acquirer_company, '') || ' ' ||
+        COALESCE(d.industry_sector, '')
+    ) @@ plainto_tsquery('english', :query)
+    ORDER BY rank DESC
+    LIMIT :limit
+""")
+
+_SEARCH_COMPANIES_QUERY = text("""
+    SELECT *,
+           ts_rank(to_tsvector('english', 
+               COALESCE(company_name, '') || ' ' || 
+               COALESCE(industry, '') || ' ' ||
+               COALESCE(sector, '')
+           ), plainto_tsquery('english', :query)) as rank
+    FROM companies
+    WHERE to_tsvector('english', 
+        COALESCE(company_name, '') || ' ' || 
+        COALESCE(industry, '') || ' ' ||
+        COALESCE(sector, '')
+    ) @@ plainto_tsquery('english', :query)
+    ORDER BY rank DESC
+    LIMIT :limit
+""")
+
+_CREATE_MIGRATIONS_TABLE_QUERY = text("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version VARCHAR(255) PRIMARY KEY,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+""")
+
+_MIGRATION_APPLIED_QUERY = text("SELECT 1 FROM schema_migrations WHERE version = :version")
+
+_RECORD_MIGRATION_QUERY = text("INSERT INTO schema_migrations (version) VALUES (:version)")
+
+_MIGRATION_STATUS_QUERY = text("SELECT * FROM schema_migrations ORDER BY applied_at DESC")
+
+# Stats queries run directly on the asyncpg pool, skipping SQLAlchemy row processing
+_STATS_SQL = """
+    SELECT 
+        relname as table_name,
+        GREATEST(reltuples, 0)::bigint as row_count,
+        pg_size_pretty(pg_total_relation_size(oid)) as size
+    FROM pg_class
+    WHERE relname = ANY($1::text[])
+      AND relkind = 'r'
+      AND relnamespace = 'public'::regnamespace
+"""
+
+# Exact counts scan every table; only used when get_database_stats(exact=True)
+_EXACT_STATS_SQL = """
+    SELECT 
+        'deals' as table_name,
+        COUNT(*) as row_count,
+        pg_size_pretty(pg_total_relation_size('deals')) as size
+    FROM deals
+    UNION ALL
+    SELECT 
+        'companies' as table_name,
+        COUNT(*) as row_count,
+        pg_size_pretty(pg_total_relation_size('companies')) as size
+    FROM companies
+    UNION ALL
+    SELECT 
+        'news_articles' as table_name,
+        COUNT(*) as row_count,
+        pg_size_pretty(pg_total_relation_size('news_articles')) as size
+    FROM news_articles
+"""
+
+
+class PostgreSQLAdapter(DatabaseAdapter, adapter_types=('postgresql', 'timescale')):
     """PostgreSQL/TimescaleDB adapter for MergerTracker"""
     
     def __init__(self, connection_config: Dict[str, Any]):
         super().__init__(connection_config)
         self.engine = None
         self.session_factory = None
+        # Raw asyncpg pool for read-only queries that skip SQLAlchemy result processing
+        self._pool: Optional[asyncpg.Pool] = None
+        
+        # Cached get_database_stats result as (monotonic timestamp, stats)
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._stats_lock = asyncio.Lock()
+        self._stats_refresh_task: Optional[asyncio.Task] = None
         
         # Build connection URL
         self.connection_url = self._build_connection_url(connection_config)
+        self._static_connection_info = {
+            'adapter': 'postgresql',
+            'host': connection_config.get('host'),
+            'database': connection_config.get('database')
+        }
     
     def _build_connection_url(self, config: Dict[str, Any]) -> str:
         """Build PostgreSQL connection URL from config"""
@@ -34,6 +170,50 @@ class PostgreSQLAdapter(DatabaseAdapter):
         # Use asyncpg driver for async operations
         return f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
     
+    def _write_pg_service_file(self, config: Dict[str, Any]) -> Optional[str]:
+        """Write a private libpq service file for pg_dump connections
+        
+        The file holds the password in plain text; callers remove it once the
+        backup is done.
+        """
+        import os
+        import tempfile
+        
+        socket_dir = config.get('backup_socket_dir') or self._local_socket_dir(config)
+        params = {
+            'host': socket_dir or config.get('host', 'localhost'),
+            'port': config.get('port', 5432),
+            'dbname': config.get('database', 'mergertracker'),
+            'user': config.get('username', 'postgres'),
+            'password': config.get('password', ''),
+        }
+        if socket_dir:
+            # Local UNIX socket connections don't need TLS negotiation
+            params['sslmode'] = 'disable'
+        
+        try:
+            # mkstemp creates the file with 0600 permissions
+            fd, path = tempfile.mkstemp(prefix='mergertracker_', suffix='.pg_service.conf')
+            with os.fdopen(fd, 'w') as f:
+                f.write(f"[{PG_SERVICE_NAME}]\n")
+                for key, value in params.items():
+                    f.write(f"{key}={value}\n")
+            return path
+        except OSError as e:
+            logger.warning(f"Could not write pg_service file, falling back to PGPASSWORD: {e}")
+            return None
+    
+    @staticmethod
+    def _local_socket_dir(config: Dict[str, Any]) -> Optional[str]:
+        """Return the default UNIX socket directory when the database is co-located"""
+        import os
+        
+        if config.get('host', 'localhost') not in ('localhost', '127.0.0.1'):
+            return None
+        
+        socket_path = os.path.join(DEFAULT_SOCKET_DIR, f".s.PGSQL.{config.get('port', 5432)}")
+        return DEFAULT_SOCKET_DIR if os.path.exists(socket_path) else None
+    
     async def connect(self) -> bool:
         """Establish connection to PostgreSQL"""
         try:
@@ -54,7 +234,21 @@ class PostgreSQLAdapter(DatabaseAdapter):
             
             # Test connection
             async with self.engine.begin() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_PING_QUERY)
+            
+            await self._prewarm(self.connection_config.get(
+                'pool_prewarm', self.connection_config.get('pool_size', 10)
+            ))
+            
+            self._pool = await asyncpg.create_pool(
+                host=self.connection_config.get('host', 'localhost'),
+                port=self.connection_config.get('port', 5432),
+                database=self.connection_config.get('database', 'mergertracker'),
+                user=self.connection_config.get('username', 'postgres'),
+                password=self.connection_config.get('password', ''),
+                min_size=self.connection_config.get('asyncpg_min_size', 5),
+                max_size=self.connection_config.get('asyncpg_max_size', 20)
+            )
             
             logger.info("Successfully connected to PostgreSQL database")
             return True
@@ -63,13 +257,33 @@ class PostgreSQLAdapter(DatabaseAdapter):
             logger.error(f"Failed to connect to PostgreSQL: {e}")
             raise ConnectionError(f"Database connection failed: {e}")
     
+    async def _prewarm(self, n: int) -> None:
+        """Open ``n`` pooled connections up front so requests don't pay connection setup"""
+        if n <= 0:
+            return
+        
+        conns = await asyncio.gather(*(self.engine.connect() for _ in range(n)), return_exceptions=True)
+        opened = [conn for conn in conns if not isinstance(conn, BaseException)]
+        
+        # Closing returns the connections to the pool
+        await asyncio.gather(*(conn.close() for conn in opened))
+        
+        if len(opened) < n:
+            logger.warning(f"Pre-warmed {len(opened)} of {n} pool connections")
+    
     async def disconnect(self) -> bool:
         """Close database connection"""
         try:
+            if self._pool:
+                await self._pool.close()
+                self._pool = None
             if self.engine:
                 await self.engine.dispose()
                 self.engine = None
                 self.session_factory = None
+            if self._stats_refresh_task and not self._stats_refresh_task.done():
+                self._stats_refresh_task.cancel()
+            self._stats_cache = None
             return True
         except Exception as e:
             logger.error(f"Error disconnecting from database: {e}")
@@ -79,7 +293,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Check database health"""
         try:
             async with self.session_factory() as session:
-                result = await session.execute(text("SELECT 1"))
+                result = await session.execute(_PING_QUERY)
                 return result.scalar() == 1
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
@@ -116,21 +330,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Get a deal by ID"""
         try:
             async with self.session_factory() as session:
-                query = text("""
-                    SELECT d.*, 
-                           t.company_name as target_name,
-                           a.company_name as acquirer_name
-                    FROM deals d
-                    LEFT JOIN companies t ON d.target_company = t.company_id
-                    LEFT JOIN companies a ON d.acquirer_company = a.company_id
-                    WHERE d.deal_id = :deal_id
-                """)
-                
-                result = await session.execute(query, {'deal_id': deal_id})
-                row = result.fetchone()
+                result = await session.execute(_GET_DEAL_QUERY, {'deal_id': deal_id})
+                row = result.mappings().first()
                 
                 if row:
-                    return dict(row._mapping)
+                    return dict(row)
                 return None
                 
         except Exception as e:
@@ -142,20 +346,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
         try:
             async with self.session_factory() as session:
                 update_data['last_updated'] = datetime.utcnow()
-                
-                query = text("""
-                    UPDATE deals 
-                    SET deal_status = COALESCE(:deal_status, deal_status),
-                        deal_value = COALESCE(:deal_value, deal_value),
-                        deal_value_currency = COALESCE(:deal_value_currency, deal_value_currency),
-                        expected_completion_date = COALESCE(:expected_completion_date, expected_completion_date),
-                        actual_completion_date = COALESCE(:actual_completion_date, actual_completion_date),
-                        last_updated = :last_updated
-                    WHERE deal_id = :deal_id
-                """)
-                
                 update_data['deal_id'] = deal_id
-                result = await session.execute(query, update_data)
+                
+                result = await session.execute(_UPDATE_DEAL_QUERY, update_data)
                 await session.commit()
                 
                 return result.rowcount > 0
@@ -168,8 +361,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Delete a deal"""
         try:
             async with self.session_factory() as session:
-                query = text("DELETE FROM deals WHERE deal_id = :deal_id")
-                result = await session.execute(query, {'deal_id': deal_id})
+                result = await session.execute(_DELETE_DEAL_QUERY, {'deal_id': deal_id})
                 await session.commit()
                 
                 return result.rowcount > 0
@@ -234,9 +426,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 """)
                 
                 result = await session.execute(query, params)
-                rows = result.fetchall()
+                rows = result.mappings().all()
                 
-                return [dict(row._mapping) for row in rows]
+                return [dict(row) for row in rows]
                 
         except Exception as e:
             logger.error(f"Error listing deals: {e}")
@@ -271,12 +463,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Get a company by ID"""
         try:
             async with self.session_factory() as session:
-                query = text("SELECT * FROM companies WHERE company_id = :company_id")
-                result = await session.execute(query, {'company_id': company_id})
-                row = result.fetchone()
+                result = await session.execute(_GET_COMPANY_QUERY, {'company_id': company_id})
+                row = result.mappings().first()
                 
                 if row:
-                    return dict(row._mapping)
+                    return dict(row)
                 return None
                 
         except Exception as e:
@@ -317,8 +508,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Delete a company"""
         try:
             async with self.session_factory() as session:
-                query = text("DELETE FROM companies WHERE company_id = :company_id")
-                result = await session.execute(query, {'company_id': company_id})
+                result = await session.execute(_DELETE_COMPANY_QUERY, {'company_id': company_id})
                 await session.commit()
                 
                 return result.rowcount > 0
@@ -362,9 +552,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 """)
                 
                 result = await session.execute(query, params)
-                rows = result.fetchall()
+                rows = result.mappings().all()
                 
-                return [dict(row._mapping) for row in rows]
+                return [dict(row) for row in rows]
                 
         except Exception as e:
             logger.error(f"Error listing companies: {e}")
@@ -398,12 +588,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Get an article by ID"""
         try:
             async with self.session_factory() as session:
-                query = text("SELECT * FROM news_articles WHERE url = :article_id OR id = :article_id")
-                result = await session.execute(query, {'article_id': article_id})
-                row = result.fetchone()
+                result = await session.execute(_GET_ARTICLE_QUERY, {'article_id': article_id})
+                row = result.mappings().first()
                 
                 if row:
-                    return dict(row._mapping)
+                    return dict(row)
                 return None
                 
         except Exception as e:
@@ -445,9 +634,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 """)
                 
                 result = await session.execute(query, params)
-                rows = result.fetchall()
+                rows = result.mappings().all()
                 
-                return [dict(row._mapping) for row in rows]
+                return [dict(row) for row in rows]
                 
         except Exception as e:
             logger.error(f"Error listing articles: {e}")
@@ -464,31 +653,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
         try:
             async with self.session_factory() as session:
                 # Use PostgreSQL full-text search
-                search_query = text("""
-                    SELECT d.*, 
-                           t.company_name as target_name,
-                           a.company_name as acquirer_name,
-                           ts_rank(to_tsvector('english', 
-                               COALESCE(d.target_company, '') || ' ' || 
-                               COALESCE(d.acquirer_company, '') || ' ' ||
-                               COALESCE(d.industry_sector, '')
-                           ), plainto_tsquery('english', :query)) as rank
-                    FROM deals d
-                    LEFT JOIN companies t ON d.target_company = t.company_id
-                    LEFT JOIN companies a ON d.acquirer_company = a.company_id
-                    WHERE to_tsvector('english', 
-                        COALESCE(d.target_company, '') || ' ' || 
-                        COALESCE(d.acquirer_company, '') || ' ' ||
-                        COALESCE(d.industry_sector, '')
-                    ) @@ plainto_tsquery('english', :query)
-                    ORDER BY rank DESC
-                    LIMIT :limit
-                """)
-                
-                result = await session.execute(search_query, {'query': query, 'limit': limit})
-                rows = result.fetchall()
+                result = await session.execute(_SEARCH_DEALS_QUERY, {'query': query, 'limit': limit})
+                rows = result.mappings().all()
                 
-                return [dict(row._mapping) for row in rows]
+                return [dict(row) for row in rows]
                 
         except Exception as e:
             logger.error(f"Error searching deals: {e}")
@@ -503,27 +671,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Search companies using full-text search"""
         try:
             async with self.session_factory() as session:
-                search_query = text("""
-                    SELECT *,
-                           ts_rank(to_tsvector('english', 
-                               COALESCE(company_name, '') || ' ' || 
-                               COALESCE(industry, '') || ' ' ||
-                               COALESCE(sector, '')
-                           ), plainto_tsquery('english', :query)) as rank
-                    FROM companies
-                    WHERE to_tsvector('english', 
-                        COALESCE(company_name, '') || ' ' || 
-                        COALESCE(industry, '') || ' ' ||
-                        COALESCE(sector, '')
-                    ) @@ plainto_tsquery('english', :query)
-                    ORDER BY rank DESC
-                    LIMIT :limit
-                """)
-                
-                result = await session.execute(search_query, {'query': query, 'limit': limit})
-                rows = result.fetchall()
+                result = await session.execute(_SEARCH_COMPANIES_QUERY, {'query': query, 'limit': limit})
+                rows = result.mappings().all()
                 
-                return [dict(row._mapping) for row in rows]
+                return [dict(row) for row in rows]
                 
         except Exception as e:
             logger.error(f"Error searching companies: {e}")
@@ -577,14 +728,14 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 """)
                 
                 result = await session.execute(analytics_query, params)
-                rows = result.fetchall()
+                rows = result.mappings().all()
                 
                 return {
-                    'trends': [dict(row._mapping) for row in rows],
+                    'trends': [dict(row) for row in rows],
                     'summary': {
-                        'total_deals': sum(row.deal_count for row in rows),
-                        'total_value': sum(row.total_value or 0 for row in rows),
-                        'avg_deal_size': sum(row.avg_value or 0 for row in rows) / len(rows) if rows else 0
+                        'total_deals': sum(row['deal_count'] for row in rows),
+                        'total_value': sum(row['total_value'] or 0 for row in rows),
+                        'avg_deal_size': sum(row['avg_value'] or 0 for row in rows) / len(rows) if rows else 0
                     }
                 }
                 
@@ -626,10 +777,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 """)
                 
                 result = await session.execute(industry_query, params)
-                rows = result.fetchall()
+                rows = result.mappings().all()
                 
                 return {
-                    'industries': [dict(row._mapping) for row in rows]
+                    'industries': [dict(row) for row in rows]
                 }
                 
         except Exception as e:
@@ -642,21 +793,16 @@ class PostgreSQLAdapter(DatabaseAdapter):
         try:
             async with self.engine.begin() as conn:
                 # Create migrations table if it doesn't exist
-                await conn.execute(text("""
-                    CREATE TABLE IF NOT EXISTS schema_migrations (
-                        version VARCHAR(255) PRIMARY KEY,
-                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """))
+                await conn.execute(_CREATE_MIGRATIONS_TABLE_QUERY)
                 
                 for migration_file in migration_files:
                     # Check if migration already applied
                     result = await conn.execute(
-                        text("SELECT 1 FROM schema_migrations WHERE version = :version"),
+                        _MIGRATION_APPLIED_QUERY,
                         {'version': migration_file}
                     )
                     
-                    if not result.fetchone():
+                    if result.scalar() is None:
                         # Read and execute migration
                         with open(migration_file, 'r') as f:
                             migration_sql = f.read()
@@ -665,7 +811,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                         
                         # Record migration
                         await conn.execute(
-                            text("INSERT INTO schema_migrations (version) VALUES (:version)"),
+                            _RECORD_MIGRATION_QUERY,
                             {'version': migration_file}
                         )
                         
@@ -681,12 +827,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Get current migration status"""
         try:
             async with self.session_factory() as session:
-                query = text("SELECT * FROM schema_migrations ORDER BY applied_at DESC")
-                result = await session.execute(query)
-                rows = result.fetchall()
+                result = await session.execute(_MIGRATION_STATUS_QUERY)
+                rows = result.mappings().all()
                 
                 return {
-                    'applied_migrations': [dict(row._mapping) for row in rows],
+                    'applied_migrations': [dict(row) for row in rows],
                     'migration_count': len(rows)
                 }
                 
@@ -695,77 +840,309 @@ class PostgreSQLAdapter(DatabaseAdapter):
             return {'applied_migrations': [], 'migration_count': 0}
     
     async def backup_data(self, backup_path: str) -> bool:
-        """Create a backup using pg_dump"""
-        import subprocess
+        """Create a backup using pg_dump
+        
+        When ``parallel_jobs`` > 1 in the connection config, pg_dump runs in
+        directory format (``-Fd``) with that many jobs and ``backup_path`` is
+        treated as a directory. Set ``backup_archive`` to package the directory
+        into ``{backup_path}.tar.zst`` afterwards.
+        
+        Otherwise a compressed custom-format (``-Fc``) archive is written to
+        ``backup_path``; ``backup_compression`` sets the level (default 3).
+        ``backup_verbose`` enables pg_dump's per-object progress output.
+        
+        An ``s3://bucket/key`` backup_path streams a custom-format dump straight
+        into a multipart upload without touching local disk.
+        
+        Local backups refuse to overwrite an existing path, since a failed run
+        removes its output.
+        """
         import os
         
+        # Only output this call created is ever cleaned up
+        created_path = None
+        service_file = None
         try:
             # Extract connection info for pg_dump
             config = self.connection_config
+            parallel_jobs = int(config.get('parallel_jobs', 1))
             
             env = os.environ.copy()
-            env['PGPASSWORD'] = config.get('password', '')
             
-            cmd = [
-                'pg_dump',
-                '-h', config.get('host', 'localhost'),
-                '-p', str(config.get('port', 5432)),
-                '-U', config.get('username', 'postgres'),
-                '-d', config.get('database', 'mergertracker'),
-                '-f', backup_path,
-                '--verbose'
-            ]
+            # libpq service file used by pg_dump (None falls back to PGPASSWORD)
+            service_file = self._write_pg_service_file(config)
+            if service_file:
+                env['PGSERVICEFILE'] = service_file
+                cmd = ['pg_dump', '-d', f'service={PG_SERVICE_NAME}']
+            else:
+                env['PGPASSWORD'] = config.get('password', '')
+                cmd = [
+                    'pg_dump',
+                    '-h', config.get('host', 'localhost'),
+                    '-p', str(config.get('port', 5432)),
+                    '-U', config.get('username', 'postgres'),
+                    '-d', config.get('database', 'mergertracker')
+                ]
+            
+            if config.get('backup_verbose', False):
+                # Per-object progress lines; streamed to the debug log, never buffered
+                cmd.append('--verbose')
             
-            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+            if backup_path.startswith('s3://'):
+                cmd.extend(['-Fc', '-Z', str(config.get('backup_compression', 3))])
+                return await self._stream_backup_to_s3(cmd, env, backup_path)
             
-            if result.returncode == 0:
-                logger.info(f"Database backup created successfully: {backup_path}")
-                return True
+            archive = parallel_jobs > 1 and config.get('backup_archive', False)
+            archive_path = f"{backup_path}.tar.zst"
+            for path in (backup_path, archive_path) if archive else (backup_path,):
+                if os.path.exists(path):
+                    logger.error(f"Backup path already exists: {path}")
+                    return False
+            
+            created_path = backup_path
+            cmd.extend(['-f', backup_path, '-Z', str(config.get('backup_compression', 3))])
+            if parallel_jobs > 1:
+                cmd.extend(['-Fd', '-j', str(parallel_jobs)])
             else:
-                logger.error(f"Backup failed: {result.stderr}")
+                cmd.append('-Fc')
+            
+            if not await self._run_backup_process(cmd, env):
+                logger.error(f"Backup failed: {backup_path}")
+                await asyncio.to_thread(self._remove_backup_output, created_path)
                 return False
+            
+            if archive:
+                parent, dirname = os.path.split(os.path.abspath(backup_path))
+                tar_cmd = ['tar', '--use-compress-program=zstd -T0', '-cf', archive_path, '-C', parent, dirname]
+                
+                if not await self._run_backup_process(tar_cmd):
+                    logger.error(f"Backup archiving failed: {archive_path}")
+                    await asyncio.to_thread(self._remove_backup_output, archive_path)
+                    return False
+                
+                await asyncio.to_thread(self._remove_backup_output, backup_path)
+                backup_path = created_path = archive_path
+            
+            logger.info(f"Database backup created successfully: {backup_path}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error creating backup: {e}")
+            if created_path:
+                await asyncio.to_thread(self._remove_backup_output, created_path)
             return False
+        finally:
+            if service_file:
+                try:
+                    os.remove(service_file)
+                except OSError as e:
+                    logger.warning(f"Failed to remove pg_service file {service_file}: {e}")
     
-    async def get_database_stats(self) -> Dict[str, Any]:
-        """Get database statistics"""
-        try:
-            async with self.session_factory() as session:
-                stats_query = text("""
-                    SELECT 
-                        'deals' as table_name,
-                        COUNT(*) as row_count,
-                        pg_size_pretty(pg_total_relation_size('deals')) as size
-                    FROM deals
-                    UNION ALL
-                    SELECT 
-                        'companies' as table_name,
-                        COUNT(*) as row_count,
-                        pg_size_pretty(pg_total_relation_size('companies')) as size
-                    FROM companies
-                    UNION ALL
-                    SELECT 
-                        'news_articles' as table_name,
-                        COUNT(*) as row_count,
-                        pg_size_pretty(pg_total_relation_size('news_articles')) as size
-                    FROM news_articles
-                """)
-                
-                result = await session.execute(stats_query)
-                rows = result.fetchall()
-                
-                return {
-                    'table_stats': [dict(row._mapping) for row in rows],
-                    'connection_info': {
-                        'adapter': 'postgresql',
-                        'host': self.connection_config.get('host'),
-                        'database': self.connection_config.get('database'),
-                        'connected': await self.health_check()
-                    }
-                }
+    async def _run_backup_process(self, cmd: List[str], env: Optional[Dict[str, str]] = None) -> bool:
+        """Run a backup subprocess, streaming its stderr into the logger"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            env=env,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        stderr_tail = await self._log_stderr(process.stderr)
+        returncode = await process.wait()
+        if returncode != 0:
+            logger.error(f"{cmd[0]} exited with status {returncode}: " + "\n".join(stderr_tail))
+            return False
+        return True
+    
+    @staticmethod
+    async def _log_stderr(stream: asyncio.StreamReader) -> deque:
+        """Stream subprocess stderr into the debug log, returning its last lines"""
+        # Keep only the tail of stderr for the error report
+        stderr_tail = deque(maxlen=20)
+        async for line in stream:
+            message = line.decode(errors='replace').rstrip()
+            stderr_tail.append(message)
+            logger.debug(message)
+        return stderr_tail
+    
+    async def _stream_backup_to_s3(self, cmd: List[str], env: Dict[str, str], backup_url: str) -> bool:
+        """Pipe pg_dump output into an S3 multipart upload"""
+        import aioboto3
+        from urllib.parse import urlparse
+        
+        config = self.connection_config
+        parsed = urlparse(backup_url)
+        bucket, key = parsed.netloc, parsed.path.lstrip('/')
+        # S3 rejects non-final multipart parts smaller than 5 MiB
+        part_size = max(int(config.get('s3_part_size', 8 << 20)), 5 << 20)
+        semaphore = asyncio.Semaphore(int(config.get('s3_upload_concurrency', 4)))
+        
+        # The upload is started before pg_dump, so an S3 or credentials error
+        # never leaves a dump process behind
+        session = aioboto3.Session()
+        async with session.client('s3', endpoint_url=config.get('s3_endpoint_url')) as s3:
+            upload = await s3.create_multipart_upload(Bucket=bucket, Key=key)
+            upload_id = upload['UploadId']
+            
+            async def upload_part(part_number: int, body: bytes) -> Dict[str, Any]:
+                try:
+                    response = await s3.upload_part(
+                        Bucket=bucket,
+                        Key=key,
+                        PartNumber=part_number,
+                        UploadId=upload_id,
+                        Body=body
+                    )
+                    return {'PartNumber': part_number, 'ETag': response['ETag']}
+                finally:
+                    semaphore.release()
+            
+            process = None
+            stderr_task = None
+            tasks = []
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    env=env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                # Drain stderr concurrently so verbose output can't stall pg_dump
+                stderr_task = asyncio.create_task(self._log_stderr(process.stderr))
+                
+                part_number = 0
+                while True:
+                    # Bound the number of parts held in memory / in flight
+                    await semaphore.acquire()
+                    chunk = await self._read_chunk(process.stdout, part_size)
+                    if not chunk and part_number:
+                        semaphore.release()
+                        break
+                    
+                    part_number += 1
+                    tasks.append(asyncio.create_task(upload_part(part_number, chunk)))
+                    if len(chunk) < part_size:
+                        break
+                
+                parts = await asyncio.gather(*tasks)
+                returncode = await process.wait()
+                stderr_tail = await stderr_task
+                
+                if returncode != 0:
+                    raise DatabaseError(f"pg_dump exited with status {returncode}: " + "\n".join(stderr_tail))
+                
+                await s3.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
                 
+            except Exception as e:
+                logger.error(f"Backup upload failed: {e}")
+                for task in tasks:
+                    task.cancel()
+                await s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+                return False
+            finally:
+                if process is not None and process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                if stderr_task is not None and not stderr_task.done():
+                    stderr_task.cancel()
+        
+        logger.info(f"Database backup streamed successfully: {backup_url}")
+        return True
+    
+    @staticmethod
+    async def _read_chunk(stream: asyncio.StreamReader, size: int) -> bytes:
+        """Read up to ``size`` bytes, only returning short at EOF"""
+        buffer = bytearray()
+        while len(buffer) < size:
+            data = await stream.read(size - len(buffer))
+            if not data:
+                break
+            buffer.extend(data)
+        return bytes(buffer)
+    
+    def _remove_backup_output(self, path: str) -> None:
+        """Remove a backup artifact, which may be a file or a directory-format dump
+        
+        Blocking; callers run it via asyncio.to_thread since directory dumps can be large.
+        """
+        import os
+        import shutil
+        
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            logger.warning(f"Failed to clean up backup output {path}: {e}")
+    
+    async def get_database_stats(self, exact: bool = False, include_health: bool = False) -> Dict[str, Any]:
+        """Get database statistics
+        
+        Row counts are estimates from pg_class.reltuples, refreshed by
+        ANALYZE/autovacuum. Pass ``exact=True`` to run COUNT(*) on each table.
+        
+        Estimated stats are cached for ``stats_cache_ttl`` seconds (default 30).
+        Once stale, the cached value is still returned while a background task
+        refreshes it; only a cold cache waits on the database.
+        
+        ``connection_info.connected`` is only reported with ``include_health=True``.
+        """
+        if include_health:
+            # health_check opens its own pooled session, so both round-trips overlap
+            stats, connected = await asyncio.gather(self._get_table_stats(exact), self.health_check())
+            return {**stats, 'connection_info': {**self._static_connection_info, 'connected': connected}}
+        
+        return await self._get_table_stats(exact)
+    
+    async def _get_table_stats(self, exact: bool) -> Dict[str, Any]:
+        """Get table statistics, serving estimates from the cache"""
+        if exact:
+            return await self._fetch_database_stats(exact=True)
+        
+        if self._stats_cache is None:
+            async with self._stats_lock:
+                if self._stats_cache is None:
+                    await self._refresh_database_stats()
+        else:
+            cached_at, _ = self._stats_cache
+            ttl = self.connection_config.get('stats_cache_ttl', 30)
+            refreshing = self._stats_refresh_task is not None and not self._stats_refresh_task.done()
+            if time.monotonic() - cached_at >= ttl and not refreshing:
+                self._stats_refresh_task = asyncio.create_task(self._refresh_database_stats_in_background())
+        
+        return self._stats_cache[1]
+    
+    async def _refresh_database_stats(self) -> None:
+        """Fetch estimated stats and store them in the cache"""
+        stats = await self._fetch_database_stats()
+        self._stats_cache = (time.monotonic(), stats)
+    
+    async def _refresh_database_stats_in_background(self) -> None:
+        """Refresh the stats cache, keeping the stale value on failure"""
+        try:
+            await self._refresh_database_stats()
+        except Exception as e:
+            logger.warning(f"Background database stats refresh failed: {e}")
+    
+    async def _fetch_database_stats(self, exact: bool = False) -> Dict[str, Any]:
+        """Query database statistics"""
+        try:
+            if exact:
+                rows = await self._pool.fetch(_EXACT_STATS_SQL)
+            else:
+                rows = await self._pool.fetch(_STATS_SQL, STATS_TABLES)
+            
+            return {
+                'table_stats': [dict(row) for row in rows],
+                'connection_info': dict(self._static_connection_info)
+            }
+            
         except Exception as e:
             logger.error(f"Error getting database stats: {e}")
             raise DatabaseError(f"Failed to get database stats: {e}")
\ No newline at end of file
@@ -7,17 +7,41 @@ full-text search, real-time subscriptions, and bulk operations.
 """
 
 import asyncio
+import copy
+import csv
+import io
+import itertools
+import json
 import logging
+import os
+import time
 import uuid
-from typing import List, Dict, Any, Optional, Union, Callable
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, Callable, Tuple, AsyncIterator
+from datetime import date, datetime, timezone
 from contextlib import asynccontextmanager
 
-from supabase import create_client, Client
+import asyncpg
+import httpx
+from cachetools import TTLCache
+from supabase import Client
 from supabase.lib.client_options import ClientOptions
 from postgrest.exceptions import APIError
 from gotrue.errors import AuthApiError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from .base import (
     DatabaseAdapter, 
     DatabaseError, 
@@ -29,8 +53,245 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+STATS_TABLES = ['deals', 'companies', 'news_articles']
+
+ADVANCED_SEARCH_TABLES = ('deals', 'companies', 'articles')
+
+REALTIME_EVENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+# Columns returned by list endpoints; detail views (get_*) still return full records
+DEAL_LIST_COLUMNS = (
+    'id', 'deal_id', 'deal_name', 'deal_type', 'deal_status',
+    'announcement_date', 'expected_completion_date', 'actual_completion_date',
+    'transaction_value', 'enterprise_value', 'currency', 'payment_method',
+    'primary_geography', 'primary_industry_sic', 'is_hostile', 'is_cross_border',
+    'created_at', 'updated_at'
+)
+COMPANY_LIST_COLUMNS = (
+    'id', 'name', 'ticker_symbol', 'exchange', 'country', 'gics_sector',
+    'gics_industry_group', 'market_cap', 'is_public', 'is_active',
+    'created_at', 'updated_at'
+)
+
+# PostgREST select trees, built once and kept whitespace-free
+_SELECT_DEAL_FULL = (
+    "*,deal_participants!inner(*,companies!inner(*)),deal_advisors(*),news_articles(*)"
+)
+_SELECT_DEAL_LIST = (
+    ",".join(DEAL_LIST_COLUMNS)
+    + ",deal_participants!left(role,companies!inner(name,ticker_symbol))"
+)
+_SELECT_COMPANY_FULL = (
+    "*,industry_classifications(sic_code,sic_description,gics_sector_name),"
+    "deal_participants!left(role,deals!inner(deal_name,deal_type,deal_status,transaction_value,announcement_date))"
+)
+_SELECT_COMPANY_LIST = (
+    ",".join(COMPANY_LIST_COLUMNS)
+    + ",industry_classifications(sic_description,gics_sector_name)"
+)
+_SELECT_DEAL_INDUSTRY_VALUES = (
+    "primary_industry_sic,industry_classifications!left(sic_description),transaction_value"
+)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to JSON text, preferring orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, default=str)
+
+
+def _json_loads(value: Union[str, bytes]) -> Any:
+    """Parse JSON text, preferring orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _encode_temporal(value: Any) -> Any:
+    """Encode a DATE/TIMESTAMPTZ column value (strings and None pass through)"""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a value for a column of unknown type; JSON types, None and scalars pass through"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+# Per-table encoders for the temporal columns declared in supabase_schema.sql
+_TEMPORAL_COLUMNS = {
+    'deals': (
+        'announcement_date', 'expected_completion_date', 'actual_completion_date',
+        'rumor_date', 'signing_date', 'regulatory_approval_date',
+        'shareholder_approval_date', 'termination_date', 'created_at', 'updated_at'
+    ),
+    'companies': ('created_at', 'updated_at'),
+    'news_articles': ('publish_date', 'last_modified_date', 'scrape_date', 'created_at', 'updated_at'),
+    'deal_participants': ('created_at', 'updated_at'),
+    'deal_advisors': ('created_at', 'updated_at'),
+}
+_COLUMN_ENCODERS = {
+    table_name: dict.fromkeys(columns, _encode_temporal)
+    for table_name, columns in _TEMPORAL_COLUMNS.items()
+}
+
+
+_subscription_counter = itertools.count()
+
+
+def _new_subscription_id() -> str:
+    """Process-unique subscription ID; these never leave the process, so no UUID is needed"""
+    return f"{time.time_ns():x}-{next(_subscription_counter):x}"
+
+
+def _generate_uuids(count: int) -> List[str]:
+    """Generate random (version 4) UUID strings from a single urandom read"""
+    buffer = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=buffer[i:i + 16], version=4))
+        for i in range(0, 16 * count, 16)
+    ]
+
+
+class _PooledClient(Client):
+    """Supabase client whose PostgREST sessions share one pooled keep-alive transport
+    
+    supabase-py builds the PostgREST client lazily and discards it on
+    SIGNED_IN / TOKEN_REFRESHED / SIGNED_OUT, so the pool is attached each
+    time it is rebuilt rather than patched onto the first instance.
+    """
+    
+    transport: Optional[httpx.HTTPTransport] = None
+    
+    def _init_postgrest_client(self, rest_url, headers, schema, timeout=30):
+        postgrest = super()._init_postgrest_client(rest_url, headers, schema, timeout)
+        if self.transport:
+            session = postgrest.session
+            postgrest.session = type(session)(
+                base_url=session.base_url,
+                headers=session.headers,
+                timeout=session.timeout,
+                transport=self.transport
+            )
+            session.close()
+        return postgrest
+
+
+@lru_cache(maxsize=4)
+def _get_client(
+    url: str,
+    key: str,
+    schema: str = "public",
+    max_connections: int = 64,
+    max_keepalive_connections: int = 32,
+    keepalive_expiry: float = 75.0
+) -> Client:
+    """Return a process-wide Supabase client so adapters share one HTTP/TLS pool"""
+    # Configure client options for better performance
+    client_options = ClientOptions(
+        postgrest_client_timeout=30,
+        storage_client_timeout=30,
+        schema=schema
+    )
+    client = _PooledClient.create(
+        supabase_url=url,
+        supabase_key=key,
+        options=client_options
+    )
+    
+    # Pooled keep-alive (HTTP/2 when available) transport sized for the
+    # executor threads that issue requests
+    client.transport = httpx.HTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+    )
+    return client
+
+
+# Direct SQL used when a Postgres connection string is configured (bypasses PostgREST)
+_GET_DEAL_SQL = """
+    SELECT d.*,
+        COALESCE((
+            SELECT json_agg(to_jsonb(p) || jsonb_build_object('companies', to_jsonb(c)))
+            FROM deal_participants p
+            JOIN companies c ON c.id = p.company_id
+            WHERE p.deal_id = d.id
+        ), '[]') AS deal_participants,
+        COALESCE((SELECT json_agg(a) FROM deal_advisors a WHERE a.deal_id = d.id), '[]') AS deal_advisors,
+        COALESCE((SELECT json_agg(n) FROM news_articles n WHERE n.deal_id = d.id), '[]') AS news_articles
+    FROM deals d
+    WHERE d.deal_id = $1::text::uuid
+"""
+
+_LIST_DEALS_SQL = """
+    SELECT {columns},
+        COALESCE((
+            SELECT json_agg(json_build_object(
+                'role', p.role,
+                'companies', json_build_object('name', c.name, 'ticker_symbol', c.ticker_symbol)
+            ))
+            FROM deal_participants p
+            JOIN companies c ON c.id = p.company_id
+            WHERE p.deal_id = d.id
+        ), '[]') AS deal_participants
+    FROM deals d
+    WHERE {where_clause}
+    ORDER BY d.{sort_by} {sort_order}, d.id {sort_order}
+    LIMIT {limit_param} OFFSET {offset_param}
+"""
+
+# json/jsonb columns of a table, so COPY staging can tell JSON lists from arrays
+_JSON_COLUMNS_SQL = """
+    SELECT attname
+    FROM pg_attribute
+    WHERE attrelid = $1::regclass
+    AND atttypid IN ('json'::regtype, 'jsonb'::regtype)
+    AND NOT attisdropped
+"""
+
+# Declared type of one column, used to cast text-bound parameters
+_COLUMN_TYPE_SQL = """
+    SELECT format_type(atttypid, atttypmod)
+    FROM pg_attribute
+    WHERE attrelid = $1::regclass
+    AND attname = $2
+    AND NOT attisdropped
+"""
 
-class SupabaseAdapter(DatabaseAdapter):
+# (filter key, PostgREST operator, column, column type) shared by the PostgREST and
+# direct SQL deal listings; SQL values are sent as text and cast server-side so
+# callers can keep passing strings
+_DEAL_FILTERS = (
+    ('deal_type', 'eq', 'deal_type', 'dealtype'),
+    ('deal_status', 'eq', 'deal_status', 'dealstatus'),
+    ('industry_sector', 'eq', 'primary_industry_sic', 'varchar'),
+    ('deal_value_min', 'gte', 'transaction_value', 'numeric'),
+    ('deal_value_max', 'lte', 'transaction_value', 'numeric'),
+    ('date_from', 'gte', 'announcement_date', 'date'),
+    ('date_to', 'lte', 'announcement_date', 'date'),
+    ('geography', 'eq', 'primary_geography', 'varchar'),
+)
+_SQL_OPERATORS = {'eq': '=', 'gte': '>=', 'lte': '<='}
+
+# PostgREST / Postgres error codes for an RPC function that is not installed
+_UNDEFINED_FUNCTION_CODES = ('PGRST202', '42883')
+
+# Postgres error code for a column that does not exist
+_UNDEFINED_COLUMN_CODE = '42703'
+
+# Column whose values key the read cache for single-record getters
+_CACHE_KEY_COLUMNS = {'deals': 'deal_id', 'companies': 'id'}
+
+
+class SupabaseAdapter(DatabaseAdapter, adapter_types=('supabase',)):
     """Supabase adapter for MergerTracker with comprehensive functionality"""
     
     def __init__(self, connection_config: Dict[str, Any]):
@@ -39,6 +300,20 @@ class SupabaseAdapter(DatabaseAdapter):
         self.connection_url = None
         self.service_key = None
         self.anon_key = None
+        self.db_url = None
+        self._pool: Optional[asyncpg.Pool] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Short-lived read cache keyed by (table, id) and cached health status
+        self._read_cache = TTLCache(
+            maxsize=connection_config.get('read_cache_size', 10000),
+            ttl=connection_config.get('read_cache_ttl', 60)
+        )
+        self._health_cache: Optional[Tuple[float, bool]] = None
+        
+        # Shared across all bulk calls so concurrent callers cannot flood PostgREST
+        self._bulk_semaphore = asyncio.Semaphore(connection_config.get('bulk_concurrency', 4))
+        
         self._subscription_callbacks = {}
         
         # Extract connection parameters
@@ -49,6 +324,8 @@ class SupabaseAdapter(DatabaseAdapter):
         self.connection_url = config.get('url')
         self.service_key = config.get('service_key')
         self.anon_key = config.get('key') or config.get('anon_key')
+        # Optional direct Postgres connection string for the hot data paths
+        self.db_url = config.get('db_url')
         
         if not self.connection_url:
             raise ValueError("Supabase URL is required")
@@ -62,22 +339,30 @@ class SupabaseAdapter(DatabaseAdapter):
     async def connect(self) -> bool:
         """Establish connection to Supabase"""
         try:
-            # Configure client options for better performance
-            client_options = ClientOptions(
-                postgrest_client_timeout=30,
-                storage_client_timeout=30,
-                schema="public"
+            # Shared client with service key for full access
+            self.client = _get_client(
+                self.connection_url,
+                self.service_key,
+                "public",
+                max_connections=self.connection_config.get('max_connections', 64),
+                max_keepalive_connections=self.connection_config.get('max_keepalive_connections', 32),
+                keepalive_expiry=self.connection_config.get('keepalive_expiry', 75.0)
             )
             
-            # Create client with service key for full access
-            self.client = create_client(
-                supabase_url=self.connection_url,
-                supabase_key=self.service_key,
-                options=client_options
-            )
-            
-            # Test connection with a simple query
-            result = self.client.table('users').select('count', count='exact').limit(0).execute()
+            if self.db_url:
+                # statement_cache_size=0 keeps the pool compatible with Supavisor/pgbouncer
+                self._pool = await asyncpg.create_pool(
+                    self.db_url,
+                    min_size=self.connection_config.get('pool_min_size', 10),
+                    max_size=self.connection_config.get('pool_max_size', 50),
+                    max_inactive_connection_lifetime=300,
+                    statement_cache_size=0,
+                    init=self._init_pg_connection
+                )
+                await self._pool.fetchval('SELECT 1')
+            else:
+                # Test connection with a simple query
+                result = await self._run(self.client.table('users').select('*', count='estimated').limit(0).execute)
             
             logger.info("Successfully connected to Supabase database")
             return True
@@ -86,6 +371,17 @@ class SupabaseAdapter(DatabaseAdapter):
             logger.error(f"Failed to connect to Supabase: {e}")
             raise ConnectionError(f"Supabase connection failed: {e}")
     
+    @staticmethod
+    async def _init_pg_connection(conn: asyncpg.Connection) -> None:
+        """Decode json/jsonb columns the same way PostgREST responses are decoded"""
+        for type_name in ('json', 'jsonb'):
+            await conn.set_type_codec(
+                type_name,
+                encoder=_json_dumps,
+                decoder=_json_loads,
+                schema='pg_catalog'
+            )
+    
     async def disconnect(self) -> bool:
         """Close Supabase connection"""
         try:
@@ -94,8 +390,16 @@ class SupabaseAdapter(DatabaseAdapter):
                 for subscription_id in list(self._subscription_callbacks.keys()):
                     await self._unsubscribe(subscription_id)
                 
-                # Supabase client doesn't need explicit disconnection
+                # The shared client lives for the whole process; only drop our reference
                 self.client = None
+            
+            if self._pool:
+                await self._pool.close()
+                self._pool = None
+            
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             return True
         except Exception as e:
             logger.error(f"Error disconnecting from Supabase: {e}")
@@ -103,17 +407,36 @@ class SupabaseAdapter(DatabaseAdapter):
     
     async def health_check(self) -> bool:
         """Check Supabase database health"""
+        now = time.monotonic()
+        if self._health_cache and now - self._health_cache[0] < self.connection_config.get('health_check_ttl', 5):
+            return self._health_cache[1]
+        
         try:
-            if not self.client:
+            if self._pool:
+                healthy = await self._pool.fetchval('SELECT 1') == 1
+            elif not self.client:
                 return False
-                
-            # Simple health check query
-            result = self.client.table('users').select('count', count='exact').limit(0).execute()
-            return result.count is not None
+            else:
+                # Simple health check query
+                result = await self._run(self.client.table('users').select('*', count='estimated').limit(0).execute)
+                healthy = result.count is not None
             
         except Exception as e:
             logger.error(f"Supabase health check failed: {e}")
-            return False
+            healthy = False
+        
+        self._health_cache = (now, healthy)
+        return healthy
+    
+    async def _run(self, fn: Callable[[], Any]) -> Any:
+        """Run a blocking supabase-py call (sync httpx) without stalling the event loop"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.connection_config.get('executor_workers', 32),
+                thread_name_prefix='supabase'
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn)
     
     def _handle_api_error(self, error: Exception, operation: str) -> None:
         """Handle and convert Supabase API errors to appropriate database errors"""
@@ -126,6 +449,13 @@ class SupabaseAdapter(DatabaseAdapter):
                 raise ValidationError(f"Required field missing in {operation}: {error.message}")
             else:
                 raise DatabaseError(f"{operation} failed: {error.message}")
+        elif isinstance(error, asyncpg.PostgresError):
+            if error.sqlstate == '23505':
+                raise DuplicateError(f"Duplicate entry in {operation}: {error}")
+            elif error.sqlstate in ('23503', '23502'):
+                raise ValidationError(f"Constraint violation in {operation}: {error}")
+            else:
+                raise DatabaseError(f"{operation} failed: {error}")
         elif isinstance(error, AuthApiError):
             raise ConnectionError(f"Authentication error in {operation}: {error.message}")
         else:
@@ -140,9 +470,9 @@ class SupabaseAdapter(DatabaseAdapter):
                 deal_data['deal_id'] = str(uuid.uuid4())
             
             # Convert datetime objects to ISO strings
-            deal_data = self._prepare_data_for_insert(deal_data)
+            deal_data = self._prepare_data_for_insert(deal_data, 'deals')
             
-            result = self.client.table('deals').insert(deal_data).execute()
+            result = await self._run(self.client.table('deals').insert(deal_data).execute)
             
             if result.data:
                 logger.info(f"Created deal: {deal_data['deal_id']}")
@@ -155,20 +485,26 @@ class SupabaseAdapter(DatabaseAdapter):
     
     async def get_deal(self, deal_id: str) -> Optional[Dict[str, Any]]:
         """Get a deal by ID with related data"""
+        cache_key = ('deals', str(deal_id))
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            result = self.client.table('deals').select("""
-                *,
-                deal_participants!inner(
-                    *,
-                    companies!inner(*)
-                ),
-                deal_advisors(*),
-                news_articles(*)
-            """).eq('deal_id', deal_id).execute()
+            if self._pool:
+                row = await self._pool.fetchrow(_GET_DEAL_SQL, str(deal_id))
+                deal = self._format_deal_response(dict(row)) if row else None
+                if deal:
+                    return self._cache_record(cache_key, deal)
+                return deal
+            
+            result = await self._run(
+                self.client.table('deals').select(_SELECT_DEAL_FULL).eq('deal_id', deal_id).execute
+            )
             
             if result.data:
-                deal = result.data[0]
-                return self._format_deal_response(deal)
+                deal = self._format_deal_response(result.data[0])
+                return self._cache_record(cache_key, deal)
             return None
             
         except Exception as e:
@@ -181,9 +517,10 @@ class SupabaseAdapter(DatabaseAdapter):
             update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
             
             # Prepare data for update
-            update_data = self._prepare_data_for_insert(update_data)
+            update_data = self._prepare_data_for_insert(update_data, 'deals')
             
-            result = self.client.table('deals').update(update_data).eq('deal_id', deal_id).execute()
+            self._read_cache.pop(('deals', str(deal_id)), None)
+            result = await self._run(self.client.table('deals').update(update_data).eq('deal_id', deal_id).execute)
             
             return len(result.data) > 0
             
@@ -193,7 +530,8 @@ class SupabaseAdapter(DatabaseAdapter):
     async def delete_deal(self, deal_id: str) -> bool:
         """Delete a deal"""
         try:
-            result = self.client.table('deals').delete().eq('deal_id', deal_id).execute()
+            self._read_cache.pop(('deals', str(deal_id)), None)
+            result = await self._run(self.client.table('deals').delete().eq('deal_id', deal_id).execute)
             return len(result.data) > 0
             
         except Exception as e:
@@ -205,63 +543,208 @@ class SupabaseAdapter(DatabaseAdapter):
         limit: int = 100,
         offset: int = 0,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        cursor: Optional[Tuple[Any, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """List deals with filtering and pagination"""
+        """List deals with filtering and pagination
+        
+        Pass the last row's ``(sort_by value, id)`` as ``cursor`` to fetch the
+        next page by keyset instead of ``offset``.
+        """
         try:
-            query = self.client.table('deals').select("""
-                *,
-                deal_participants!left(
-                    role,
-                    companies!inner(name, ticker_symbol)
-                )
-            """)
+            if self._pool:
+                return await self._list_deals_sql(filters, limit, offset, sort_by, sort_order, cursor)
+            
+            query = self.client.table('deals').select(_SELECT_DEAL_LIST)
             
             # Apply filters
             if filters:
                 query = self._apply_deal_filters(query, filters)
             
-            # Apply sorting
-            if sort_order.lower() == 'desc':
-                query = query.order(sort_by, desc=True)
-            else:
-                query = query.order(sort_by, desc=False)
+            # Apply sorting, with id as a tie-breaker so keyset pages are stable
+            descending = sort_order.lower() == 'desc'
+            query = self._order_keyset(query, sort_by, descending)
             
             # Apply pagination
-            query = query.range(offset, offset + limit - 1)
+            query = self._apply_pagination(query, limit, offset, sort_by, cursor, descending)
             
-            result = query.execute()
+            result = await self._run(query.execute)
             
             return [self._format_deal_response(deal) for deal in result.data]
             
         except Exception as e:
             self._handle_api_error(e, "list_deals")
     
-    def _apply_deal_filters(self, query, filters: Dict[str, Any]):
-        """Apply filters to deal queries"""
-        if filters.get('deal_type'):
-            query = query.eq('deal_type', filters['deal_type'])
+    async def _list_deals_sql(
+        self,
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        offset: int,
+        sort_by: str,
+        sort_order: str,
+        cursor: Optional[Tuple[Any, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """List deals directly over the asyncpg pool"""
+        sql, args = self._build_list_deals_sql(filters, limit, offset, sort_by, sort_order, cursor)
+        rows = await self._pool.fetch(sql, *args)
+        return [self._format_deal_response(dict(row)) for row in rows]
+    
+    def iter_deals(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        batch_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream deals one at a time instead of materializing the full result
         
-        if filters.get('deal_status'):
-            query = query.eq('deal_status', filters['deal_status'])
+        Uses a server-side cursor when the asyncpg pool is available and
+        keyset-paged PostgREST requests of ``batch_size`` rows otherwise.
+        """
+        if self._pool:
+            return self._iter_deals_sql(filters, sort_by, sort_order, batch_size)
+        return self._iter_deals_paged(filters, sort_by, sort_order, batch_size)
+    
+    async def _iter_deals_sql(
+        self,
+        filters: Optional[Dict[str, Any]],
+        sort_by: str,
+        sort_order: str,
+        batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream deals through an asyncpg server-side cursor"""
+        # LIMIT NULL leaves the result unbounded
+        sql, args = self._build_list_deals_sql(filters, None, 0, sort_by, sort_order)
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    async for row in conn.cursor(sql, *args, prefetch=batch_size):
+                        yield self._format_deal_response(dict(row))
+        except asyncpg.PostgresError as e:
+            self._handle_api_error(e, "iter_deals")
+    
+    async def _iter_deals_paged(
+        self,
+        filters: Optional[Dict[str, Any]],
+        sort_by: str,
+        sort_order: str,
+        batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream deals by walking keyset pages through PostgREST"""
+        cursor = None
+        while True:
+            page = await self.list_deals(filters, batch_size, 0, sort_by, sort_order, cursor)
+            for deal in page:
+                yield deal
+            
+            if len(page) < batch_size:
+                return
+            cursor = (page[-1].get(sort_by), page[-1]['id'])
+    
+    def _build_list_deals_sql(
+        self,
+        filters: Optional[Dict[str, Any]],
+        limit: Optional[int],
+        offset: int,
+        sort_by: str,
+        sort_order: str,
+        cursor: Optional[Tuple[Any, Any]] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build the direct SQL deal listing and its positional arguments"""
+        if not sort_by.isidentifier():
+            raise ValidationError(f"Invalid sort column: {sort_by}")
         
-        if filters.get('industry_sector'):
-            query = query.eq('primary_industry_sic', filters['industry_sector'])
+        where_clauses = []
+        args = []
+        for key, operator, column, column_type in _DEAL_FILTERS:
+            if filters and filters.get(key):
+                args.append(str(filters[key]))
+                where_clauses.append(
+                    f"d.{column} {_SQL_OPERATORS[operator]} ${len(args)}::text::{column_type}"
+                )
         
-        if filters.get('deal_value_min'):
-            query = query.gte('transaction_value', filters['deal_value_min'])
+        descending = sort_order.lower() == 'desc'
+        if cursor:
+            # NULL sort keys come first when descending and last when ascending
+            sort_value, last_id = cursor
+            operator = '<' if descending else '>'
+            if sort_value is None:
+                args.append(last_id)
+                keyset = f"(d.{sort_by} IS NULL AND d.id {operator} ${len(args)})"
+                if descending:
+                    keyset = f"({keyset} OR d.{sort_by} IS NOT NULL)"
+            else:
+                args.extend(cursor)
+                keyset = f"(d.{sort_by}, d.id) {operator} (${len(args) - 1}, ${len(args)})"
+                if not descending:
+                    keyset = f"({keyset} OR d.{sort_by} IS NULL)"
+            where_clauses.append(keyset)
+            offset = 0
         
-        if filters.get('deal_value_max'):
-            query = query.lte('transaction_value', filters['deal_value_max'])
+        args.extend([limit, offset])
+        sql = _LIST_DEALS_SQL.format(
+            columns=", ".join(f"d.{column}" for column in DEAL_LIST_COLUMNS),
+            where_clause=" AND ".join(where_clauses) if where_clauses else "TRUE",
+            sort_by=sort_by,
+            sort_order='DESC' if descending else 'ASC',
+            limit_param=f"${len(args) - 1}",
+            offset_param=f"${len(args)}"
+        )
         
-        if filters.get('date_from'):
-            query = query.gte('announcement_date', filters['date_from'])
+        return sql, args
+    
+    @staticmethod
+    def _apply_pagination(
+        query,
+        limit: int,
+        offset: int,
+        sort_by: str,
+        cursor: Optional[Tuple[Any, Any]],
+        descending: bool
+    ):
+        """Page by keyset on (sort_by, id) when a cursor is given, otherwise by offset"""
+        if not cursor:
+            return query.range(offset, offset + limit - 1)
         
-        if filters.get('date_to'):
-            query = query.lte('announcement_date', filters['date_to'])
+        if not sort_by.isidentifier():
+            raise ValidationError(f"Invalid sort column: {sort_by}")
         
-        if filters.get('geography'):
-            query = query.eq('primary_geography', filters['geography'])
+        # PostgREST sorts NULLs first when descending and last when ascending
+        sort_value, last_id = cursor
+        operator = 'lt' if descending else 'gt'
+        after_id = f'id.{operator}.{SupabaseAdapter._quote_filter_value(last_id)}'
+        if sort_value is None:
+            conditions = [f'and({sort_by}.is.null,{after_id})']
+            if descending:
+                conditions.append(f'{sort_by}.not.is.null')
+        else:
+            quoted_value = SupabaseAdapter._quote_filter_value(sort_value)
+            conditions = [
+                f'{sort_by}.{operator}.{quoted_value}',
+                f'and({sort_by}.eq.{quoted_value},{after_id})'
+            ]
+            if not descending:
+                conditions.append(f'{sort_by}.is.null')
+        return query.or_(','.join(conditions)).limit(limit)
+    
+    @staticmethod
+    def _order_keyset(query, sort_by: str, descending: bool):
+        """Order by (sort_by, id) in a single order parameter, as PostgREST reads only one"""
+        direction = 'desc' if descending else 'asc'
+        return query.order(f'{sort_by}.{direction},id', desc=descending)
+    
+    @staticmethod
+    def _quote_filter_value(value: Any) -> str:
+        """Double-quote a PostgREST filter value so reserved characters survive"""
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+        return f'"{escaped}"'
+    
+    def _apply_deal_filters(self, query, filters: Dict[str, Any]):
+        """Apply filters to deal queries"""
+        for key, operator, column, _ in _DEAL_FILTERS:
+            value = filters.get(key)
+            if value:
+                query = getattr(query, operator)(column, value)
         
         return query
     
@@ -273,9 +756,9 @@ class SupabaseAdapter(DatabaseAdapter):
             if 'id' not in company_data:
                 company_data['id'] = None  # Let PostgreSQL generate the ID
             
-            company_data = self._prepare_data_for_insert(company_data)
+            company_data = self._prepare_data_for_insert(company_data, 'companies')
             
-            result = self.client.table('companies').insert(company_data).execute()
+            result = await self._run(self.client.table('companies').insert(company_data).execute)
             
             if result.data:
                 company_id = str(result.data[0]['id'])
@@ -289,18 +772,18 @@ class SupabaseAdapter(DatabaseAdapter):
     
     async def get_company(self, company_id: str) -> Optional[Dict[str, Any]]:
         """Get a company by ID"""
+        cache_key = ('companies', str(company_id))
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            result = self.client.table('companies').select("""
-                *,
-                industry_classifications(*),
-                deal_participants!left(
-                    role,
-                    deals!inner(deal_name, deal_type, deal_status, transaction_value, announcement_date)
-                )
-            """).eq('id', company_id).execute()
+            result = await self._run(
+                self.client.table('companies').select(_SELECT_COMPANY_FULL).eq('id', company_id).execute
+            )
             
             if result.data:
-                return result.data[0]
+                return self._cache_record(cache_key, result.data[0])
             return None
             
         except Exception as e:
@@ -310,9 +793,10 @@ class SupabaseAdapter(DatabaseAdapter):
         """Update an existing company"""
         try:
             update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
-            update_data = self._prepare_data_for_insert(update_data)
+            update_data = self._prepare_data_for_insert(update_data, 'companies')
             
-            result = self.client.table('companies').update(update_data).eq('id', company_id).execute()
+            self._read_cache.pop(('companies', str(company_id)), None)
+            result = await self._run(self.client.table('companies').update(update_data).eq('id', company_id).execute)
             
             return len(result.data) > 0
             
@@ -322,7 +806,8 @@ class SupabaseAdapter(DatabaseAdapter):
     async def delete_company(self, company_id: str) -> bool:
         """Delete a company"""
         try:
-            result = self.client.table('companies').delete().eq('id', company_id).execute()
+            self._read_cache.pop(('companies', str(company_id)), None)
+            result = await self._run(self.client.table('companies').delete().eq('id', company_id).execute)
             return len(result.data) > 0
             
         except Exception as e:
@@ -332,14 +817,12 @@ class SupabaseAdapter(DatabaseAdapter):
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Tuple[Any, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """List companies with filtering and pagination"""
+        """List companies with filtering and pagination (keyset via ``(name, id)`` cursor)"""
         try:
-            query = self.client.table('companies').select("""
-                *,
-                industry_classifications(sic_description, gics_sector_name)
-            """)
+            query = self.client.table('companies').select(_SELECT_COMPANY_LIST)
             
             # Apply filters
             if filters:
@@ -359,9 +842,10 @@ class SupabaseAdapter(DatabaseAdapter):
                     query = query.eq('is_public', filters['is_public'])
             
             # Apply pagination
-            query = query.range(offset, offset + limit - 1).order('name')
+            query = self._apply_pagination(query, limit, offset, 'name', cursor, False)
+            query = self._order_keyset(query, 'name', False)
             
-            result = query.execute()
+            result = await self._run(query.execute)
             return result.data
             
         except Exception as e:
@@ -375,9 +859,9 @@ class SupabaseAdapter(DatabaseAdapter):
             if 'article_id' not in article_data:
                 article_data['article_id'] = str(uuid.uuid4())
             
-            article_data = self._prepare_data_for_insert(article_data)
+            article_data = self._prepare_data_for_insert(article_data, 'news_articles')
             
-            result = self.client.table('news_articles').insert(article_data).execute()
+            result = await self._run(self.client.table('news_articles').insert(article_data).execute)
             
             if result.data:
                 article_id = article_data['article_id']
@@ -391,26 +875,45 @@ class SupabaseAdapter(DatabaseAdapter):
     
     async def get_article(self, article_id: str) -> Optional[Dict[str, Any]]:
         """Get an article by ID"""
+        cache_key = ('news_articles', str(article_id))
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Try by article_id first, then by URL
-            result = self.client.table('news_articles').select('*').or_(
-                f'article_id.eq.{article_id},url.eq.{article_id}'
-            ).execute()
+            try:
+                result = await self._run(self.client.rpc('get_article_by_id_or_url', {
+                    'v': str(article_id)
+                }).execute)
+            except APIError as e:
+                logger.warning(f"get_article_by_id_or_url RPC not available, using filtered select: {e}")
+                result = await self._run(self._article_lookup_query(str(article_id)).execute)
             
             if result.data:
-                return result.data[0]
+                return self._cache_record(cache_key, result.data[0])
             return None
             
         except Exception as e:
             self._handle_api_error(e, f"get_article({article_id})")
     
+    def _article_lookup_query(self, article_id: str):
+        """Build a parameterized select matching article_id (when a UUID) or URL"""
+        query = self.client.table('news_articles').select('*')
+        try:
+            uuid.UUID(article_id)
+        except ValueError:
+            return query.eq('url', article_id).limit(1)
+        return query.eq('article_id', article_id).limit(1)
+    
     async def list_articles(
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Tuple[Any, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """List articles with filtering and pagination"""
+        """List articles with filtering and pagination (keyset via ``(publish_date, id)`` cursor)"""
         try:
             query = self.client.table('news_articles').select('*')
             
@@ -432,9 +935,10 @@ class SupabaseAdapter(DatabaseAdapter):
                     query = query.gte('ma_relevance_score', filters['ma_relevance_min'])
             
             # Apply pagination and sorting
-            query = query.range(offset, offset + limit - 1).order('publish_date', desc=True)
+            query = self._apply_pagination(query, limit, offset, 'publish_date', cursor, True)
+            query = self._order_keyset(query, 'publish_date', True)
             
-            result = query.execute()
+            result = await self._run(query.execute)
             return result.data
             
         except Exception as e:
@@ -450,10 +954,10 @@ class SupabaseAdapter(DatabaseAdapter):
         """Search deals using full-text search"""
         try:
             # Use the search function we created in the schema
-            result = self.client.rpc('search_deals', {
+            result = await self._run(self.client.rpc('search_deals', {
                 'search_text': query,
                 'max_results': limit
-            }).execute()
+            }).execute)
             
             return result.data
             
@@ -471,10 +975,10 @@ class SupabaseAdapter(DatabaseAdapter):
         """Search companies using full-text search"""
         try:
             # Use the search function we created in the schema
-            result = self.client.rpc('search_companies', {
+            result = await self._run(self.client.rpc('search_companies', {
                 'search_text': query,
                 'max_results': limit
-            }).execute()
+            }).execute)
             
             return result.data
             
@@ -512,7 +1016,7 @@ class SupabaseAdapter(DatabaseAdapter):
                     search_query = search_query.gte('ma_relevance_score', filters['ma_relevance_min'])
             
             # Order by relevance and limit results
-            result = search_query.order('ma_relevance_score', desc=True).limit(limit).execute()
+            result = await self._run(search_query.order('ma_relevance_score', desc=True).limit(limit).execute)
             
             return result.data
             
@@ -526,8 +1030,22 @@ class SupabaseAdapter(DatabaseAdapter):
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """Fallback text search using ILIKE patterns"""
+        """Fallback text search using the stored search vector, then ILIKE patterns"""
         try:
+            if table_name in ('deals', 'companies'):
+                try:
+                    result = await self._run(
+                        self.client.table(table_name).select('*').limit(limit).text_search(
+                            'search_tsv', query, options={'config': 'english', 'type': 'web_search'}
+                        ).execute
+                    )
+                    return result.data
+                except APIError as e:
+                    # Only a missing search_tsv column falls back to ILIKE
+                    if e.code != _UNDEFINED_COLUMN_CODE:
+                        raise
+                    logger.warning(f"search_tsv not available on {table_name}, using ILIKE search: {e}")
+            
             search_query = self.client.table(table_name).select('*')
             
             # Use ILIKE for case-insensitive pattern matching
@@ -544,7 +1062,7 @@ class SupabaseAdapter(DatabaseAdapter):
                     f'title.ilike.%{query}%,content.ilike.%{query}%,summary.ilike.%{query}%'
                 )
             
-            result = search_query.limit(limit).execute()
+            result = await self._run(search_query.limit(limit).execute)
             return result.data
             
         except Exception as e:
@@ -554,31 +1072,47 @@ class SupabaseAdapter(DatabaseAdapter):
         self,
         search_params: Dict[str, Any]
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """Advanced search across multiple tables"""
+        """Advanced search across multiple tables
+        
+        ``search_params['tables']`` limits the search to a subset of
+        ``deals``, ``companies`` and ``articles`` (all three by default).
+        """
         try:
-            results = {
-                'deals': [],
-                'companies': [],
-                'articles': []
-            }
-            
             query = search_params.get('query', '')
+            if not query:
+                return {'deals': [], 'companies': [], 'articles': []}
+            
             filters = search_params.get('filters', {})
             limit_per_table = search_params.get('limit_per_table', 25)
+            tables = set(search_params.get('tables', ADVANCED_SEARCH_TABLES))
+            results = {table: [] for table in ADVANCED_SEARCH_TABLES}
             
-            if query:
-                # Search all tables concurrently
-                tasks = [
-                    self.search_deals(query, filters, limit_per_table),
-                    self.search_companies(query, filters, limit_per_table),
-                    self.search_articles(query, filters, limit_per_table)
-                ]
-                
-                deals_results, companies_results, articles_results = await asyncio.gather(*tasks)
-                
-                results['deals'] = deals_results
-                results['companies'] = companies_results
-                results['articles'] = articles_results
+            if not filters and tables.issuperset(ADVANCED_SEARCH_TABLES):
+                # One round trip for all three tables
+                try:
+                    result = await self._run(self.client.rpc('search_all', {
+                        'q': query,
+                        'lim': limit_per_table
+                    }).execute)
+                    
+                    data = result.data or {}
+                    for table in ADVANCED_SEARCH_TABLES:
+                        results[table] = data.get(table, [])
+                    return results
+                except Exception as e:
+                    logger.warning(f"search_all RPC not available, searching tables individually: {e}")
+            
+            # Search only the requested tables, concurrently
+            searches = {
+                'deals': self.search_deals,
+                'companies': self.search_companies,
+                'articles': self.search_articles
+            }
+            requested = [table for table in ADVANCED_SEARCH_TABLES if table in tables]
+            table_results = await asyncio.gather(*[
+                searches[table](query, filters, limit_per_table) for table in requested
+            ])
+            results.update(zip(requested, table_results))
             
             return results
             
@@ -595,11 +1129,11 @@ class SupabaseAdapter(DatabaseAdapter):
         """Get deal analytics and trends"""
         try:
             # Use the analytics function we created in the schema
-            result = self.client.rpc('get_deal_analytics', {
+            result = await self._run(self.client.rpc('get_deal_analytics', {
                 'date_from': date_from.date() if date_from else None,
                 'date_to': date_to.date() if date_to else None,
                 'group_by_period': group_by
-            }).execute()
+            }).execute)
             
             trends = result.data
             
@@ -627,54 +1161,80 @@ class SupabaseAdapter(DatabaseAdapter):
     ) -> Dict[str, Any]:
         """Get industry-wise deal analytics"""
         try:
-            query = self.client.table('deals').select("""
-                primary_industry_sic,
-                industry_classifications!left(sic_description),
-                transaction_value,
-                id
-            """, count='exact')
-            
-            if date_from:
-                query = query.gte('announcement_date', date_from.date())
-            
-            if date_to:
-                query = query.lte('announcement_date', date_to.date())
-            
-            result = query.execute()
-            
-            # Process the data to group by industry
-            industry_stats = {}
-            for deal in result.data:
-                industry = deal.get('primary_industry_sic', 'Unknown')
-                industry_name = (
-                    deal.get('industry_classifications', {}).get('sic_description', 'Unknown')
-                    if deal.get('industry_classifications') else 'Unknown'
-                )
-                
-                if industry not in industry_stats:
-                    industry_stats[industry] = {
-                        'industry': industry_name,
-                        'deal_count': 0,
-                        'total_value': 0,
-                        'avg_value': 0
-                    }
-                
-                industry_stats[industry]['deal_count'] += 1
-                if deal.get('transaction_value'):
-                    industry_stats[industry]['total_value'] += float(deal['transaction_value'])
+            # Aggregation runs server-side; one row comes back per industry
+            try:
+                result = await self._run(self.client.rpc('get_industry_analytics', {
+                    'date_from': date_from.date() if date_from else None,
+                    'date_to': date_to.date() if date_to else None
+                }).execute)
+            except Exception as e:
+                logger.warning(f"get_industry_analytics RPC not available, aggregating client-side: {e}")
+                return {
+                    'industries': await self._aggregate_industry_analytics(date_from, date_to)
+                }
             
-            # Calculate averages
-            for stats in industry_stats.values():
-                if stats['deal_count'] > 0:
-                    stats['avg_value'] = stats['total_value'] / stats['deal_count']
+            industries = [
+                {
+                    'industry': row['industry'],
+                    'deal_count': row['deal_count'],
+                    'total_value': float(row['total_value'] or 0),
+                    'avg_value': float(row['avg_value'] or 0)
+                }
+                for row in result.data
+            ]
             
             return {
-                'industries': list(industry_stats.values())
+                'industries': industries
             }
             
         except Exception as e:
             self._handle_api_error(e, "get_industry_analytics")
     
+    async def _aggregate_industry_analytics(
+        self,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime]
+    ) -> List[Dict[str, Any]]:
+        """Group deals by industry client-side with vectorized numpy reductions"""
+        import numpy as np
+        
+        query = self.client.table('deals').select(_SELECT_DEAL_INDUSTRY_VALUES)
+        
+        if date_from:
+            query = query.gte('announcement_date', date_from.date())
+        
+        if date_to:
+            query = query.lte('announcement_date', date_to.date())
+        
+        deals = (await self._run(query.execute)).data
+        if not deals:
+            return []
+        
+        industry_codes = [deal.get('primary_industry_sic') or 'Unknown' for deal in deals]
+        values = np.fromiter(
+            (float(deal.get('transaction_value') or 0) for deal in deals),
+            dtype=np.float64,
+            count=len(deals)
+        )
+        
+        codes, first_index, inverse = np.unique(
+            np.asarray(industry_codes), return_index=True, return_inverse=True
+        )
+        deal_counts = np.bincount(inverse, minlength=len(codes))
+        total_values = np.bincount(inverse, weights=values, minlength=len(codes))
+        
+        industries = []
+        for i in range(len(codes)):
+            classification = deals[first_index[i]].get('industry_classifications') or {}
+            industries.append({
+                'industry': classification.get('sic_description', 'Unknown'),
+                'deal_count': int(deal_counts[i]),
+                'total_value': float(total_values[i]),
+                'avg_value': float(total_values[i] / deal_counts[i])
+            })
+        
+        return industries
+    
     # Migration operations
     async def run_migrations(self, migration_files: List[str]) -> bool:
         """Run database migrations - Supabase handles this via their dashboard"""
@@ -695,51 +1255,71 @@ class SupabaseAdapter(DatabaseAdapter):
         logger.warning("Supabase backups are handled automatically - use Supabase dashboard for manual backups")
         return True
     
-    async def get_database_stats(self) -> Dict[str, Any]:
-        """Get database statistics and health metrics"""
+    async def get_database_stats(self, include_health: bool = False) -> Dict[str, Any]:
+        """Get database statistics and, optionally, health metrics"""
         try:
-            # Get table counts
-            deals_count = self.client.table('deals').select('count', count='exact').limit(0).execute().count
-            companies_count = self.client.table('companies').select('count', count='exact').limit(0).execute().count
-            articles_count = self.client.table('news_articles').select('count', count='exact').limit(0).execute().count
+            connection_info = {
+                'adapter': 'supabase',
+                'url': self.connection_url
+            }
+            
+            if include_health:
+                table_stats, connection_info['connected'] = await asyncio.gather(
+                    self._get_table_stats(),
+                    self.health_check()
+                )
+            else:
+                table_stats = await self._get_table_stats()
             
             return {
-                'table_stats': [
-                    {'table_name': 'deals', 'row_count': deals_count, 'size': 'N/A'},
-                    {'table_name': 'companies', 'row_count': companies_count, 'size': 'N/A'},
-                    {'table_name': 'news_articles', 'row_count': articles_count, 'size': 'N/A'}
-                ],
-                'connection_info': {
-                    'adapter': 'supabase',
-                    'url': self.connection_url,
-                    'connected': await self.health_check()
-                }
+                'table_stats': table_stats,
+                'connection_info': connection_info
             }
             
         except Exception as e:
             self._handle_api_error(e, "get_database_stats")
     
+    async def _get_table_stats(self) -> List[Dict[str, Any]]:
+        """Get estimated row counts for the core tables in one round trip"""
+        try:
+            result = await self._run(self.client.rpc('get_table_stats', {
+                'table_names': STATS_TABLES
+            }).execute)
+            return result.data
+            
+        except Exception as e:
+            # Fallback to PostgREST count estimates if RPC function is not available
+            logger.warning(f"get_table_stats RPC not available, falling back to count estimates: {e}")
+            results = await asyncio.gather(*[
+                self._run(self.client.table(table_name).select('*', count='estimated').limit(0).execute)
+                for table_name in STATS_TABLES
+            ])
+            return [
+                {'table_name': table_name, 'row_count': result.count, 'size': 'N/A'}
+                for table_name, result in zip(STATS_TABLES, results)
+            ]
+    
     # Bulk operations for performance
     async def bulk_insert_deals(self, deals_data: List[Dict[str, Any]]) -> List[str]:
         """Bulk insert deals for performance"""
         try:
-            # Prepare all data
-            prepared_data = []
-            deal_ids = []
+            # Fill missing IDs, then prepare all rows in one pass
+            missing = [deal_data for deal_data in deals_data if 'deal_id' not in deal_data]
+            for deal_data, new_id in zip(missing, _generate_uuids(len(missing))):
+                deal_data['deal_id'] = new_id
             
-            for deal_data in deals_data:
-                if 'deal_id' not in deal_data:
-                    deal_data['deal_id'] = str(uuid.uuid4())
-                
-                deal_ids.append(deal_data['deal_id'])
-                prepared_data.append(self._prepare_data_for_insert(deal_data))
+            deal_ids = [deal_data['deal_id'] for deal_data in deals_data]
+            prepared_data = self._prepare_batch(deals_data)
+            
+            if self._pool:
+                await self._upsert_rows_sql('deals', prepared_data, ['deal_id'])
+                self._invalidate_cached('deals', deal_ids)
+                logger.info(f"Bulk inserted/updated {len(prepared_data)} deals")
+                return deal_ids
             
-            # Batch insert with upsert to handle duplicates
-            result = self.client.table('deals').upsert(
-                prepared_data, 
-                on_conflict='deal_id',
-                returning='minimal'  # Reduce response size for performance
-            ).execute()
+            # Chunked upsert to handle duplicates and stay under request size limits
+            await self._upsert_in_chunks('deals', prepared_data, 'deal_id')
+            self._invalidate_cached('deals', deal_ids)
             
             logger.info(f"Bulk inserted/updated {len(prepared_data)} deals")
             return deal_ids
@@ -750,23 +1330,22 @@ class SupabaseAdapter(DatabaseAdapter):
     async def bulk_insert_articles(self, articles_data: List[Dict[str, Any]]) -> List[str]:
         """Bulk insert news articles for performance"""
         try:
-            # Prepare all data
-            prepared_data = []
-            article_ids = []
+            # Fill missing IDs, then prepare all rows in one pass
+            missing = [article_data for article_data in articles_data if 'article_id' not in article_data]
+            for article_data, new_id in zip(missing, _generate_uuids(len(missing))):
+                article_data['article_id'] = new_id
             
-            for article_data in articles_data:
-                if 'article_id' not in article_data:
-                    article_data['article_id'] = str(uuid.uuid4())
-                
-                article_ids.append(article_data['article_id'])
-                prepared_data.append(self._prepare_data_for_insert(article_data))
+            article_ids = [article_data['article_id'] for article_data in articles_data]
+            prepared_data = self._prepare_batch(articles_data)
             
-            # Batch insert with upsert to handle duplicates
-            result = self.client.table('news_articles').upsert(
-                prepared_data,
-                on_conflict='url',
-                returning='minimal'  # Reduce response size for performance
-            ).execute()
+            if self._pool:
+                await self._upsert_rows_sql('news_articles', prepared_data, ['url'])
+            else:
+                # Chunked upsert to handle duplicates and stay under request size limits
+                await self._upsert_in_chunks('news_articles', prepared_data, 'url')
+            for article_data in prepared_data:
+                self._read_cache.pop(('news_articles', str(article_data['article_id'])), None)
+                self._read_cache.pop(('news_articles', str(article_data.get('url'))), None)
             
             logger.info(f"Bulk inserted/updated {len(prepared_data)} articles")
             return article_ids
@@ -778,56 +1357,137 @@ class SupabaseAdapter(DatabaseAdapter):
         """Bulk insert companies for performance"""
         try:
             # Prepare all data
-            prepared_data = []
+            prepared_data = self._prepare_batch(companies_data)
             company_ids = []
             
-            for company_data in companies_data:
-                prepared_data.append(self._prepare_data_for_insert(company_data))
-            
-            # Batch insert
-            result = self.client.table('companies').upsert(
-                prepared_data,
-                on_conflict='cusip,isin,lei',  # Handle duplicates based on unique identifiers
-                returning='minimal'
-            ).execute()
+            # Chunked upsert, handling duplicates based on unique identifiers
+            results = await self._upsert_in_chunks(
+                'companies', prepared_data, 'cusip,isin,lei', returning='representation'
+            )
             
-            if result.data:
-                company_ids = [str(record.get('id', '')) for record in result.data]
+            for result in results:
+                if result.data:
+                    company_ids.extend(str(record.get('id', '')) for record in result.data)
             
+            self._invalidate_cached('companies', company_ids)
             logger.info(f"Bulk inserted/updated {len(prepared_data)} companies")
             return company_ids
                 
         except Exception as e:
             self._handle_api_error(e, "bulk_insert_companies")
     
+    def _get_cached(self, cache_key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached record so callers cannot mutate the cache"""
+        # A single lookup, as an entry can expire between a membership test and a read
+        record = self._read_cache.get(cache_key)
+        return copy.deepcopy(record) if record is not None else None
+    
+    def _cache_record(self, cache_key: Tuple[str, str], record: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a freshly read record and return a copy the caller may modify"""
+        self._read_cache[cache_key] = record
+        return copy.deepcopy(record)
+    
+    def _invalidate_cached(self, table_name: str, ids: List[Any]) -> None:
+        """Drop cached single-record reads for the given IDs"""
+        for record_id in ids:
+            self._read_cache.pop((table_name, str(record_id)), None)
+    
+    def _invalidate_deleted(self, table_name: str, ids: List[Any], id_column: str) -> None:
+        """Drop cached reads for deleted rows
+        
+        The IDs are only usable as cache keys when they come from the column
+        the getters cache on; otherwise every cached row of the table is dropped.
+        """
+        if _CACHE_KEY_COLUMNS.get(table_name) == id_column:
+            self._invalidate_cached(table_name, ids)
+            return
+        
+        for cache_key in [key for key in self._read_cache if key[0] == table_name]:
+            self._read_cache.pop(cache_key, None)
+    
+    async def _upsert_in_chunks(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        on_conflict: str,
+        returning: str = 'minimal'
+    ) -> List[Any]:
+        """Upsert rows through PostgREST in bounded, concurrently submitted chunks"""
+        chunk_size = self.connection_config.get('bulk_chunk_size', 500)
+        
+        async def push(chunk: List[Dict[str, Any]]):
+            async with self._bulk_semaphore:
+                return await self._run(
+                    self.client.table(table_name).upsert(
+                        chunk,
+                        on_conflict=on_conflict,
+                        returning=returning  # 'minimal' reduces response size when IDs aren't needed
+                    ).execute
+                )
+        
+        results = await asyncio.gather(
+            *[push(rows[i:i + chunk_size]) for i in range(0, len(rows), chunk_size)],
+            return_exceptions=True
+        )
+        
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            logger.error(f"{len(errors)} of {len(results)} upsert chunks failed for {table_name}")
+            raise errors[0]
+        
+        return results
+    
     async def bulk_update_deals(self, updates: List[Dict[str, Any]]) -> int:
-        """Bulk update deals by deal_id"""
+        """Bulk update deals by deal_id
+        
+        Each batch is applied by the bulk_update_deals RPC in one UPDATE;
+        only the keys present in an update are changed and updated_at is
+        set server-side with NOW().
+        """
         try:
-            update_count = 0
+            prepared_updates = self._prepare_batch(
+                [update_data for update_data in updates if 'deal_id' in update_data]
+            )
             
-            # Process updates in batches to avoid hitting limits
-            batch_size = 100
-            for i in range(0, len(updates), batch_size):
-                batch = updates[i:i + batch_size]
-                
-                # Prepare batch data
-                prepared_batch = []
-                for update_data in batch:
-                    if 'deal_id' not in update_data:
-                        continue
+            async def update_batch(prepared_batch: List[Dict[str, Any]]) -> int:
+                async with self._bulk_semaphore:
+                    if self._pool:
+                        # Each batch runs on its own pooled connection and transaction
+                        batch_count = await self._pool.fetchval(
+                            'SELECT bulk_update_deals($1::jsonb)', prepared_batch
+                        ) or 0
+                        self._invalidate_cached('deals', [row['deal_id'] for row in prepared_batch])
+                        return batch_count
                     
-                    prepared_data = self._prepare_data_for_insert(update_data)
-                    prepared_data['updated_at'] = datetime.now(timezone.utc).isoformat()
-                    prepared_batch.append(prepared_data)
+                    try:
+                        result = await self._run(self.client.rpc('bulk_update_deals', {
+                            'payload': prepared_batch
+                        }).execute)
+                        batch_count = result.data or 0
+                    except APIError as e:
+                        # Fall back to upserts only if the RPC function is not installed;
+                        # errors raised inside it must not turn updates into inserts
+                        if e.code not in _UNDEFINED_FUNCTION_CODES:
+                            raise
+                        logger.warning(f"bulk_update_deals RPC not available, falling back to upsert: {e}")
+                        updated_at = datetime.now(timezone.utc).isoformat()
+                        await self._run(self.client.table('deals').upsert(
+                            [{**row, 'updated_at': updated_at} for row in prepared_batch],
+                            on_conflict='deal_id',
+                            returning='minimal'
+                        ).execute)
+                        batch_count = len(prepared_batch)
                 
-                if prepared_batch:
-                    result = self.client.table('deals').upsert(
-                        prepared_batch,
-                        on_conflict='deal_id',
-                        returning='minimal'
-                    ).execute()
-                    
-                    update_count += len(prepared_batch)
+                self._invalidate_cached('deals', [row['deal_id'] for row in prepared_batch])
+                return batch_count
+            
+            # Process updates in concurrent batches to avoid hitting limits
+            batch_size = self.connection_config.get('bulk_chunk_size', 500)
+            batch_counts = await asyncio.gather(*[
+                update_batch(prepared_updates[i:i + batch_size])
+                for i in range(0, len(prepared_updates), batch_size)
+            ])
+            update_count = sum(batch_counts)
             
             logger.info(f"Bulk updated {update_count} deals")
             return update_count
@@ -841,10 +1501,38 @@ class SupabaseAdapter(DatabaseAdapter):
             if not ids:
                 return 0
             
-            # Supabase doesn't support bulk delete directly, so we use filter
-            result = self.client.table(table_name).delete().in_(id_column, ids).execute()
+            self._invalidate_deleted(table_name, ids, id_column)
+            
+            if self._pool:
+                # One statement with the IDs bound as an array, cast to the column's type
+                async with self._pool.acquire() as conn:
+                    column_type = await conn.fetchval(_COLUMN_TYPE_SQL, table_name, id_column)
+                    if column_type is None:
+                        raise ValidationError(f"Unknown column {table_name}.{id_column}")
+                    
+                    status = await conn.execute(
+                        f"DELETE FROM {self._quote_ident(table_name)} "
+                        f"WHERE {self._quote_ident(id_column)} = ANY($1::text[]::{column_type}[])",
+                        [str(record_id) for record_id in ids]
+                    )
+                delete_count = int(status.split()[-1])
+            else:
+                # Supabase doesn't support bulk delete directly, so we use filter;
+                # IDs are chunked to keep each request URL short
+                chunk_size = self.connection_config.get('delete_chunk_size', 100)
+                
+                async def delete_chunk(chunk: List[str]) -> int:
+                    async with self._bulk_semaphore:
+                        result = await self._run(
+                            self.client.table(table_name).delete().in_(id_column, chunk).execute
+                        )
+                    return len(result.data) if result.data else 0
+                
+                delete_counts = await asyncio.gather(*[
+                    delete_chunk(ids[i:i + chunk_size]) for i in range(0, len(ids), chunk_size)
+                ])
+                delete_count = sum(delete_counts)
             
-            delete_count = len(result.data) if result.data else 0
             logger.info(f"Bulk deleted {delete_count} records from {table_name}")
             return delete_count
                 
@@ -854,101 +1542,147 @@ class SupabaseAdapter(DatabaseAdapter):
     async def bulk_insert_deal_participants(self, participants_data: List[Dict[str, Any]]) -> List[str]:
         """Bulk insert deal participants"""
         try:
-            prepared_data = []
-            for participant_data in participants_data:
-                prepared_data.append(self._prepare_data_for_insert(participant_data))
+            prepared_data = self._prepare_batch(participants_data)
             
-            result = self.client.table('deal_participants').upsert(
-                prepared_data,
-                on_conflict='deal_id,company_id,role',
-                returning='minimal'
-            ).execute()
+            if self._pool:
+                participant_ids = await self._upsert_rows_sql(
+                    'deal_participants', prepared_data, ['deal_id', 'company_id', 'role'], returning='id'
+                )
+            else:
+                results = await self._upsert_in_chunks(
+                    'deal_participants', prepared_data, 'deal_id,company_id,role', returning='representation'
+                )
+                participant_ids = [
+                    record['id'] for result in results if result.data for record in result.data
+                ]
             
             logger.info(f"Bulk inserted/updated {len(prepared_data)} deal participants")
-            return [str(i) for i in range(len(prepared_data))]  # Return placeholder IDs
+            return [str(participant_id) for participant_id in participant_ids]
                 
         except Exception as e:
             self._handle_api_error(e, "bulk_insert_deal_participants")
     
+    async def _upsert_rows_sql(
+        self,
+        table_name: str,
+        rows: List[Dict[str, Any]],
+        conflict_columns: List[str],
+        returning: Optional[str] = None
+    ) -> List[Any]:
+        """Upsert rows over the asyncpg pool in one statement per distinct column set
+        
+        Rows are shipped as a JSON array and expanded server-side with
+        jsonb_populate_recordset, so Postgres performs the same type coercion
+        PostgREST would. Groups larger than ``copy_threshold`` rows are
+        streamed into a temporary staging table with COPY first. When
+        ``returning`` names a column, its values for the written rows are
+        returned.
+        """
+        copy_threshold = self.connection_config.get('copy_threshold', 1000)
+        returning_clause = f" RETURNING {self._quote_ident(returning)}" if returning else ""
+        returned: List[Any] = []
+        rows_by_columns: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in rows:
+            rows_by_columns.setdefault(tuple(row.keys()), []).append(row)
+        
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                for index, (columns, column_rows) in enumerate(rows_by_columns.items()):
+                    column_list = ", ".join(self._quote_ident(c) for c in columns)
+                    updates = ", ".join(
+                        f"{self._quote_ident(c)} = EXCLUDED.{self._quote_ident(c)}"
+                        for c in columns if c not in conflict_columns
+                    )
+                    conflict = ", ".join(self._quote_ident(c) for c in conflict_columns)
+                    on_conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+                    
+                    if len(column_rows) > copy_threshold:
+                        stage = f"_upsert_stage_{index}"
+                        await conn.execute(
+                            f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                            f"SELECT {column_list} FROM {self._quote_ident(table_name)} WITH NO DATA"
+                        )
+                        json_columns = {
+                            row['attname'] for row in await conn.fetch(_JSON_COLUMNS_SQL, table_name)
+                        }
+                        await conn.copy_to_table(
+                            stage,
+                            source=self._rows_to_csv(columns, column_rows, json_columns),
+                            columns=list(columns),
+                            format='csv',
+                            null='\\N'
+                        )
+                        records = await conn.fetch(
+                            f"INSERT INTO {self._quote_ident(table_name)} ({column_list}) "
+                            f"SELECT {column_list} FROM {stage} "
+                            f"ON CONFLICT ({conflict}) {on_conflict}{returning_clause}"
+                        )
+                    else:
+                        records = await conn.fetch(
+                            f"INSERT INTO {self._quote_ident(table_name)} ({column_list}) "
+                            f"SELECT {column_list} FROM jsonb_populate_recordset(NULL::{self._quote_ident(table_name)}, $1::jsonb) "
+                            f"ON CONFLICT ({conflict}) {on_conflict}{returning_clause}",
+                            column_rows
+                        )
+                    returned.extend(record[0] for record in records)
+        
+        return returned
+    
+    @staticmethod
+    def _rows_to_csv(columns: tuple, rows: List[Dict[str, Any]], json_columns: set) -> io.BytesIO:
+        """Render rows as CSV text input for COPY, letting Postgres coerce types"""
+        def to_copy_value(column: str, value: Any) -> Any:
+            if value is None:
+                return '\\N'
+            if column in json_columns or isinstance(value, dict):
+                return _json_dumps(value)
+            if isinstance(value, (list, tuple)):
+                # Postgres array literal with every element quoted
+                return '{' + ','.join(
+                    '"' + str(item).replace('\\', '\\\\').replace('"', '\\"') + '"'
+                    for item in value
+                ) + '}'
+            return value
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([to_copy_value(column, row[column]) for column in columns])
+        return io.BytesIO(buffer.getvalue().encode('utf-8'))
+    
+    @staticmethod
+    def _quote_ident(name: str) -> str:
+        """Quote a SQL identifier"""
+        return '"' + name.replace('"', '""') + '"'
+    
     # Real-time subscription support
     async def subscribe_to_deals(self, callback: Callable[[Dict[str, Any]], None]) -> str:
         """Subscribe to real-time deal updates"""
-        try:
-            subscription_id = str(uuid.uuid4())
-            
-            def handle_changes(payload):
-                try:
-                    # Transform payload to standardized format
-                    event_data = {
-                        'table': 'deals',
-                        'event_type': payload.get('eventType', 'unknown'),
-                        'record': payload.get('new', payload.get('old', {})),
-                        'old_record': payload.get('old'),
-                        'timestamp': datetime.now(timezone.utc).isoformat(),
-                        'subscription_id': subscription_id
-                    }
-                    callback(event_data)
-                except Exception as e:
-                    logger.error(f"Error in deals subscription callback: {e}")
-            
-            # Note: In a real implementation, you would use Supabase's realtime client
-            # For now, we store the callback for potential future use
-            self._subscription_callbacks[subscription_id] = {
-                'table': 'deals',
-                'callback': handle_changes,
-                'filters': {},
-                'created_at': datetime.now(timezone.utc)
-            }
-            
-            logger.info(f"Created deals subscription: {subscription_id}")
-            return subscription_id
-            
-        except Exception as e:
-            logger.error(f"Failed to create deals subscription: {e}")
-            raise DatabaseError(f"Subscription failed: {e}")
+        return await self._make_subscription('deals', 'deals', callback)
     
     async def subscribe_to_articles(self, callback: Callable[[Dict[str, Any]], None]) -> str:
         """Subscribe to real-time article updates"""
-        try:
-            subscription_id = str(uuid.uuid4())
-            
-            def handle_changes(payload):
-                try:
-                    event_data = {
-                        'table': 'news_articles',
-                        'event_type': payload.get('eventType', 'unknown'),
-                        'record': payload.get('new', payload.get('old', {})),
-                        'old_record': payload.get('old'),
-                        'timestamp': datetime.now(timezone.utc).isoformat(),
-                        'subscription_id': subscription_id
-                    }
-                    callback(event_data)
-                except Exception as e:
-                    logger.error(f"Error in articles subscription callback: {e}")
-            
-            self._subscription_callbacks[subscription_id] = {
-                'table': 'news_articles',
-                'callback': handle_changes,
-                'filters': {},
-                'created_at': datetime.now(timezone.utc)
-            }
-            
-            logger.info(f"Created articles subscription: {subscription_id}")
-            return subscription_id
-            
-        except Exception as e:
-            logger.error(f"Failed to create articles subscription: {e}")
-            raise DatabaseError(f"Subscription failed: {e}")
+        return await self._make_subscription('news_articles', 'articles', callback)
     
     async def subscribe_to_companies(self, callback: Callable[[Dict[str, Any]], None]) -> str:
         """Subscribe to real-time company updates"""
+        return await self._make_subscription('companies', 'companies', callback)
+    
+    async def _make_subscription(
+        self,
+        table_name: str,
+        label: str,
+        callback: Callable[[Dict[str, Any]], None]
+    ) -> str:
+        """Register an unfiltered subscription that forwards every change on a table"""
         try:
-            subscription_id = str(uuid.uuid4())
+            subscription_id = _new_subscription_id()
             
             def handle_changes(payload):
                 try:
+                    # Transform payload to standardized format
                     event_data = {
-                        'table': 'companies',
+                        'table': table_name,
                         'event_type': payload.get('eventType', 'unknown'),
                         'record': payload.get('new', payload.get('old', {})),
                         'old_record': payload.get('old'),
@@ -957,20 +1691,22 @@ class SupabaseAdapter(DatabaseAdapter):
                     }
                     callback(event_data)
                 except Exception as e:
-                    logger.error(f"Error in companies subscription callback: {e}")
+                    logger.error(f"Error in {label} subscription callback: {e}")
             
-            self._subscription_callbacks[subscription_id] = {
-                'table': 'companies',
+            # Note: In a real implementation, you would use Supabase's realtime client
+            # For now, we store the callback for potential future use
+            self._register_subscription(subscription_id, {
+                'table': table_name,
                 'callback': handle_changes,
                 'filters': {},
                 'created_at': datetime.now(timezone.utc)
-            }
+            })
             
-            logger.info(f"Created companies subscription: {subscription_id}")
+            logger.info(f"Created {label} subscription: {subscription_id}")
             return subscription_id
             
         except Exception as e:
-            logger.error(f"Failed to create companies subscription: {e}")
+            logger.error(f"Failed to create {label} subscription: {e}")
             raise DatabaseError(f"Subscription failed: {e}")
     
     async def subscribe_with_filters(
@@ -982,22 +1718,28 @@ class SupabaseAdapter(DatabaseAdapter):
     ) -> str:
         """Subscribe to real-time updates with filters and event types"""
         try:
-            subscription_id = str(uuid.uuid4())
+            subscription_id = _new_subscription_id()
             
             # Default to all events if not specified
             if events is None:
-                events = ['INSERT', 'UPDATE', 'DELETE']
+                events = REALTIME_EVENTS
+            
+            # Build the per-event checks once instead of re-walking filters per event
+            allowed_events = frozenset(events)
+            matches_filters = self._compile_realtime_filter(filters)
             
             def handle_changes(payload):
                 try:
                     event_type = payload.get('eventType', 'unknown').upper()
                     
                     # Filter by event type
-                    if event_type not in events:
+                    if event_type not in allowed_events:
                         return
                     
                     # Apply custom filters if provided
-                    if filters and not self._apply_realtime_filters(payload, filters):
+                    if matches_filters is not None and not matches_filters(
+                        payload.get('new', payload.get('old', {}))
+                    ):
                         return
                     
                     event_data = {
@@ -1012,13 +1754,13 @@ class SupabaseAdapter(DatabaseAdapter):
                 except Exception as e:
                     logger.error(f"Error in filtered subscription callback: {e}")
             
-            self._subscription_callbacks[subscription_id] = {
+            self._register_subscription(subscription_id, {
                 'table': table_name,
                 'callback': handle_changes,
                 'filters': filters or {},
                 'events': events,
                 'created_at': datetime.now(timezone.utc)
-            }
+            })
             
             logger.info(f"Created filtered subscription for {table_name}: {subscription_id}")
             return subscription_id
@@ -1027,30 +1769,33 @@ class SupabaseAdapter(DatabaseAdapter):
             logger.error(f"Failed to create filtered subscription: {e}")
             raise DatabaseError(f"Subscription failed: {e}")
     
-    def _apply_realtime_filters(self, payload: Dict[str, Any], filters: Dict[str, Any]) -> bool:
-        """Apply filters to real-time event payload"""
-        try:
-            record = payload.get('new', payload.get('old', {}))
-            
-            for field, expected_value in filters.items():
-                record_value = record.get(field)
-                
-                # Simple equality check - can be extended for more complex filters
-                if record_value != expected_value:
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error applying realtime filters: {e}")
-            return False
+    def _register_subscription(self, subscription_id: str, subscription_info: Dict[str, Any]) -> None:
+        """Store a subscription record"""
+        # Format the creation time once; list/status calls return the cached string
+        created_at = subscription_info.get('created_at')
+        subscription_info['created_at_iso'] = created_at.isoformat() if created_at else None
+        self._subscription_callbacks[subscription_id] = subscription_info
+    
+    @staticmethod
+    def _compile_realtime_filter(
+        filters: Optional[Dict[str, Any]]
+    ) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """Specialize equality filters into a record predicate at subscribe time"""
+        if not filters:
+            return None
+        
+        items = tuple(filters.items())
+        if len(items) == 1:
+            (field, expected_value), = items
+            return lambda record: record.get(field) == expected_value
+        
+        return lambda record: all(record.get(field) == value for field, value in items)
     
     async def _unsubscribe(self, subscription_id: str) -> bool:
         """Unsubscribe from real-time updates"""
         try:
             if subscription_id in self._subscription_callbacks:
-                subscription_info = self._subscription_callbacks[subscription_id]
-                del self._subscription_callbacks[subscription_id]
+                subscription_info = self._subscription_callbacks.pop(subscription_id)
                 
                 logger.info(f"Unsubscribed from {subscription_info.get('table', 'unknown')}: {subscription_id}")
                 return True
@@ -1059,20 +1804,24 @@ class SupabaseAdapter(DatabaseAdapter):
             logger.error(f"Failed to unsubscribe {subscription_id}: {e}")
             return False
     
+    @staticmethod
+    def _subscription_summary(subscription_id: str, sub_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Public view of a stored subscription"""
+        return {
+            'subscription_id': subscription_id,
+            'table': sub_info.get('table'),
+            'filters': sub_info.get('filters', {}),
+            'events': sub_info.get('events', []),
+            'created_at': sub_info.get('created_at_iso')
+        }
+    
     async def list_active_subscriptions(self) -> List[Dict[str, Any]]:
         """List all active subscriptions"""
         try:
-            subscriptions = []
-            for sub_id, sub_info in self._subscription_callbacks.items():
-                subscriptions.append({
-                    'subscription_id': sub_id,
-                    'table': sub_info.get('table'),
-                    'filters': sub_info.get('filters', {}),
-                    'events': sub_info.get('events', []),
-                    'created_at': sub_info.get('created_at', '').isoformat() if sub_info.get('created_at') else None
-                })
-            
-            return subscriptions
+            return [
+                self._subscription_summary(sub_id, sub_info)
+                for sub_id, sub_info in self._subscription_callbacks.items()
+            ]
             
         except Exception as e:
             logger.error(f"Error listing subscriptions: {e}")
@@ -1083,14 +1832,7 @@ class SupabaseAdapter(DatabaseAdapter):
         try:
             if subscription_id in self._subscription_callbacks:
                 sub_info = self._subscription_callbacks[subscription_id]
-                return {
-                    'subscription_id': subscription_id,
-                    'table': sub_info.get('table'),
-                    'filters': sub_info.get('filters', {}),
-                    'events': sub_info.get('events', []),
-                    'created_at': sub_info.get('created_at', '').isoformat() if sub_info.get('created_at') else None,
-                    'active': True
-                }
+                return {**self._subscription_summary(subscription_id, sub_info), 'active': True}
             
             return {
                 'subscription_id': subscription_id,
@@ -1102,48 +1844,57 @@ class SupabaseAdapter(DatabaseAdapter):
             return None
     
     # Utility methods
-    def _prepare_data_for_insert(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare data for insertion by converting types as needed"""
-        prepared_data = {}
-        
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                # Convert datetime to ISO string
-                prepared_data[key] = value.isoformat()
-            elif isinstance(value, (list, dict)):
-                # Keep JSON-serializable types as-is
-                prepared_data[key] = value
-            elif value is None:
-                # Keep None values
-                prepared_data[key] = value
-            else:
-                # Convert other types to string if needed
-                prepared_data[key] = value
+    def _prepare_batch(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Prepare many rows for insertion at once
         
-        return prepared_data
+        With orjson a single dumps/loads round trip converts every datetime
+        (and date, UUID) in C; otherwise rows are prepared one by one.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.loads(orjson.dumps(rows, default=str))
+        return list(map(self._prepare_data_for_insert, rows))
+    
+    def _prepare_data_for_insert(self, data: Dict[str, Any], table_name: Optional[str] = None) -> Dict[str, Any]:
+        """Prepare data for insertion by converting types as needed"""
+        # Known DATE/TIMESTAMPTZ columns get their encoder directly; everything else
+        # goes through the generic check so unexpected date values still serialize
+        encoders = _COLUMN_ENCODERS.get(table_name, {})
+        return {
+            key: encoders.get(key, _encode_value)(value)
+            for key, value in data.items()
+        }
     
     def _format_deal_response(self, deal: Dict[str, Any]) -> Dict[str, Any]:
-        """Format deal response to include participant companies"""
-        formatted_deal = deal.copy()
+        """Format deal response to include participant companies
         
+        The deal is updated in place; callers pass freshly decoded rows
+        they own, so no copy is made.
+        """
         # Extract company information from participants
         participants = deal.get('deal_participants', [])
         if participants:
-            target_companies = [
-                p['companies'] for p in participants 
-                if p.get('role') == 'target' and p.get('companies')
-            ]
-            acquirer_companies = [
-                p['companies'] for p in participants 
-                if p.get('role') == 'acquirer' and p.get('companies')
-            ]
+            # Single pass, stopping once the first target and acquirer are found
+            target = acquirer = None
+            for participant in participants:
+                company = participant.get('companies')
+                if not company:
+                    continue
+                
+                role = participant.get('role')
+                if role == 'target' and target is None:
+                    target = company
+                elif role == 'acquirer' and acquirer is None:
+                    acquirer = company
+                
+                if target is not None and acquirer is not None:
+                    break
             
-            if target_companies:
-                formatted_deal['target_name'] = target_companies[0].get('name')
-            if acquirer_companies:
-                formatted_deal['acquirer_name'] = acquirer_companies[0].get('name')
+            if target is not None:
+                deal['target_name'] = target.get('name')
+            if acquirer is not None:
+                deal['acquirer_name'] = acquirer.get('name')
         
-        return formatted_deal
+        return deal
     
     # Context manager support for connection management
     @asynccontextmanager
@@ -5,30 +5,37 @@ This module provides a factory pattern for creating database adapters
 based on configuration settings.
 """
 
+import importlib
 import logging
 from typing import Dict, Any
 from .adapters.base import DatabaseAdapter, DatabaseConfig
-from .adapters.postgresql_adapter import PostgreSQLAdapter
-from .adapters.supabase_adapter import SupabaseAdapter
 
 logger = logging.getLogger(__name__)
 
+# Modules defining the built-in adapters; each is imported on first use so
+# drivers for unused backends are never loaded
+_ADAPTER_MODULES = {
+    'postgresql': '.adapters.postgresql_adapter',
+    'timescale': '.adapters.postgresql_adapter',  # TimescaleDB uses PostgreSQL adapter
+    'supabase': '.adapters.supabase_adapter',     # Supabase adapter implemented
+    # 'firebase': '.adapters.firebase_adapter',   # To be implemented
+}
+
 
 class DatabaseFactory:
     """Factory for creating database adapters"""
     
-    _adapters = {
-        'postgresql': PostgreSQLAdapter,
-        'timescale': PostgreSQLAdapter,  # TimescaleDB uses PostgreSQL adapter
-        'supabase': SupabaseAdapter,     # Supabase adapter implemented
-        # 'firebase': FirebaseAdapter,     # To be implemented
-    }
+    # Shared with DatabaseAdapter, which registers subclasses as they are defined
+    _adapters = DatabaseAdapter._registry
     
     @classmethod
     def create_adapter(cls, config: DatabaseConfig) -> DatabaseAdapter:
         """Create a database adapter based on configuration"""
         adapter_type = config.adapter_type.lower()
         
+        if adapter_type not in cls._adapters and adapter_type in _ADAPTER_MODULES:
+            importlib.import_module(_ADAPTER_MODULES[adapter_type], __package__)
+        
         if adapter_type not in cls._adapters:
             raise ValueError(f"Unsupported database adapter type: {adapter_type}")
         
@@ -38,7 +45,7 @@ class DatabaseFactory:
     @classmethod
     def get_supported_adapters(cls) -> list:
         """Get list of supported adapter types"""
-        return list(cls._adapters.keys())
+        return list(dict.fromkeys([*_ADAPTER_MODULES, *cls._adapters]))
     
     @classmethod
     def register_adapter(cls, adapter_type: str, adapter_class):
@@ -90,6 +97,7 @@ def get_database_config_from_env() -> DatabaseConfig:
             'url': supabase_url,
             'anon_key': supabase_anon_key,
             'service_key': supabase_service_key,
+            'db_url': os.getenv('SUPABASE_DB_URL'),
         }
     elif adapter_type.lower() == 'firebase':
         connection_params = {
@@ -5,44 +5,79 @@ Uses mock data when Supabase is not available
 """
 
 import asyncio
+import itertools
 import sys
 import os
 import logging
+import random
 import time
 import json
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from config.event_loop import install_uvloop
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+INDUSTRIES = ('Technology', 'Healthcare', 'Finance', 'Energy')
+
+
+def write_jsonl(path: str, records: Iterable[Dict[str, Any]]) -> None:
+    """Write records as JSON Lines, encoding and writing one record at a time"""
+    if ORJSON_AVAILABLE:
+        # orjson encodes datetimes natively and writes UTF-8 bytes directly
+        with open(path, 'wb') as f:
+            for record in records:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open(path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record, default=datetime.isoformat))
+                f.write('\n')
+
+
+def emit(*lines: str) -> None:
+    """Write a block of report lines to stdout in a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
 
 class MockScraper:
     """Mock scraper to simulate real scraping behavior"""
     
+    __slots__ = ('name', 'items_count', 'duration', 'success_rate', '_min_items')
+    
     def __init__(self, name: str, items_count: int, duration: int, success_rate: float = 0.9):
         self.name = name
         self.items_count = items_count
         self.duration = duration
         self.success_rate = success_rate
+        # A successful run scrapes between 70% and 100% of items_count
+        self._min_items = int(items_count * 0.7)
     
     async def scrape(self) -> Dict[str, Any]:
         """Simulate scraping process"""
-        logger.info(f"🕷️  Starting {self.name} scraper...")
+        logger.info("🕷️  Starting %s scraper...", self.name)
         
         # Simulate scraping time
         await asyncio.sleep(self.duration)
         
         # Simulate success/failure
-        import random
         success = random.random() < self.success_rate
         
         if success:
-            items_scraped = random.randint(int(self.items_count * 0.7), self.items_count)
-            logger.info(f"✅ {self.name} completed: {items_scraped} items scraped")
+            items_scraped = random.randint(self._min_items, self.items_count)
+            logger.info("✅ %s completed: %s items scraped", self.name, items_scraped)
             
             return {
                 'spider': self.name,
@@ -52,7 +87,7 @@ class MockScraper:
                 'sample_data': self._generate_sample_data(items_scraped)
             }
         else:
-            logger.error(f"❌ {self.name} failed")
+            logger.error("❌ %s failed", self.name)
             return {
                 'spider': self.name,
                 'success': False,
@@ -61,19 +96,40 @@ class MockScraper:
                 'error': 'Simulated failure'
             }
     
+    async def run(self) -> Dict[str, Any]:
+        """Scrape, reporting a crash as a failed run instead of losing it"""
+        try:
+            return await self.scrape()
+        except Exception as e:
+            logger.exception("💥 %s crashed", self.name)
+            return {
+                'spider': self.name,
+                'success': False,
+                'items_scraped': 0,
+                'duration': 0,
+                'error': str(e)
+            }
+    
     def _generate_sample_data(self, count: int) -> list:
         """Generate sample M&A data"""
+        n = min(count, 5)  # Only show first 5 for demo
+        
+        # Draw random values and format the timestamp once for the whole batch
+        industries = random.choices(INDUSTRIES, k=n)
+        scraped_at = datetime.now(timezone.utc).isoformat()
+        source = self.name
+        
         sample_deals = [
             {
                 'title': f'Major Tech Acquisition Deal #{i+1}',
                 'target_company': f'TechTarget{i+1} Inc',
                 'acquirer_company': f'BigCorp{i+1} Ltd',
                 'deal_value': round(random.uniform(500, 5000) * 1000000, 2),
-                'industry': random.choice(['Technology', 'Healthcare', 'Finance', 'Energy']),
-                'source': self.name,
-                'scraped_at': datetime.utcnow().isoformat()
+                'industry': industry,
+                'source': source,
+                'scraped_at': scraped_at
             }
-            for i in range(min(count, 5))  # Only show first 5 for demo
+            for i, industry in enumerate(industries)
         ]
         return sample_deals
 
@@ -81,11 +137,13 @@ class MockScraper:
 async def demo_parallel_scraping():
     """Demonstrate parallel scraping capabilities"""
     
-    print("🚀 MergerTracker Parallel Scraping Demo")
-    print("="*60)
-    print("This demo simulates scraping Bloomberg and Ion Analytics")
-    print("in parallel and storing results in Supabase.")
-    print()
+    emit(
+        "🚀 MergerTracker Parallel Scraping Demo",
+        "="*60,
+        "This demo simulates scraping Bloomberg and Ion Analytics",
+        "in parallel and storing results in Supabase.",
+        ""
+    )
     
     # Create mock scrapers
     scrapers = [
@@ -97,88 +155,100 @@ async def demo_parallel_scraping():
     start_time = time.time()
     logger.info("Starting parallel scraping simulation...")
     
-    # Run scrapers concurrently
-    tasks = [scraper.scrape() for scraper in scrapers]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # Calculate summary
-    total_duration = time.time() - start_time
-    total_items = sum(r.get('items_scraped', 0) for r in results if isinstance(r, dict))
-    successful_scrapers = sum(1 for r in results if isinstance(r, dict) and r.get('success', False))
+    # Run scrapers concurrently, displaying each result as soon as it finishes
+    emit("\n📊 SCRAPING RESULTS", "-" * 60)
     
-    # Display results
-    print("\n📊 SCRAPING RESULTS")
-    print("-" * 60)
+    # Summary totals, storage statistics and the combined scraped data are
+    # all gathered in the same pass as results arrive
+    total_items = 0
+    successful_scrapers = 0
+    all_data = []
+    industries = set()
+    target_companies = set()
+    total_value = 0
     
-    for result in results:
+    tasks = [scraper.run() for scraper in scrapers]
+    for next_result in asyncio.as_completed(tasks):
+        result = await next_result
+        
         if isinstance(result, dict):
             status = "✅ SUCCESS" if result['success'] else "❌ FAILED"
             items = result.get('items_scraped', 0)
             duration = result.get('duration', 0)
+            total_items += items
+            
+            lines = [f"{result['spider']:<20} | {status:<10} | {items:>3} items | {duration:>4.1f}s"]
             
-            print(f"{result['spider']:<20} | {status:<10} | {items:>3} items | {duration:>4.1f}s")
+            if result['success']:
+                successful_scrapers += 1
             
             # Show sample data for successful scrapers
             if result['success'] and 'sample_data' in result:
-                print(f"Sample data from {result['spider']}:")
+                all_data.extend(result['sample_data'])
+                for item in result['sample_data']:
+                    industries.add(item['industry'])
+                    target_companies.add(item['target_company'])
+                    total_value += item['deal_value']
+                lines.append(f"Sample data from {result['spider']}:")
                 for item in result['sample_data'][:2]:  # Show first 2 items
-                    print(f"  📄 {item['title']}")
-                    print(f"     Target: {item['target_company']} | Acquirer: {item['acquirer_company']}")
-                    print(f"     Value: ${item['deal_value']:,.0f} | Industry: {item['industry']}")
-                print()
-    
-    # Summary statistics
-    print("-" * 60)
-    print(f"⏱️  Total Duration: {total_duration:.1f} seconds")
-    print(f"📈 Total Items: {total_items}")
-    print(f"✅ Success Rate: {successful_scrapers}/{len(scrapers)} ({successful_scrapers/len(scrapers)*100:.1f}%)")
-    print(f"🚀 Throughput: {total_items/total_duration:.1f} items/second")
-    
-    # Simulate database storage
-    print("\n💾 SIMULATING DATABASE STORAGE")
-    print("-" * 60)
-    
-    # Combine all scraped data
-    all_data = []
-    for result in results:
-        if isinstance(result, dict) and result.get('success') and 'sample_data' in result:
-            all_data.extend(result['sample_data'])
+                    lines.append(f"  📄 {item['title']}")
+                    lines.append(f"     Target: {item['target_company']} | Acquirer: {item['acquirer_company']}")
+                    lines.append(f"     Value: ${item['deal_value']:,.0f} | Industry: {item['industry']}")
+                lines.append("")
+            
+            emit(*lines)
+    
+    # Calculate summary
+    total_duration = time.time() - start_time
+    
+    # Summary statistics and database storage (simulated), written as one block
+    lines = [
+        "-" * 60,
+        f"⏱️  Total Duration: {total_duration:.1f} seconds",
+        f"📈 Total Items: {total_items}",
+        f"✅ Success Rate: {successful_scrapers}/{len(scrapers)} ({successful_scrapers/len(scrapers)*100:.1f}%)",
+        f"🚀 Throughput: {total_items/total_duration:.1f} items/second",
+        "\n💾 SIMULATING DATABASE STORAGE",
+        "-" * 60
+    ]
     
     if all_data:
-        print("📊 Data that would be stored in Supabase:")
-        print(f"   • {len(all_data)} M&A deals")
-        print(f"   • Industries: {', '.join(set(item['industry'] for item in all_data))}")
-        print(f"   • Total value: ${sum(item['deal_value'] for item in all_data):,.0f}")
-        
-        # Show database operations that would happen
-        print("\n🗄️  Database operations (simulated):")
-        print("   ✅ Connected to Supabase")
-        print(f"   ✅ Inserted {len(all_data)} deals into 'deals' table")
-        print(f"   ✅ Updated {len(set(item['target_company'] for item in all_data))} companies")
-        print(f"   ✅ Created {len(all_data)} news article entries")
-        print("   ✅ Updated analytics tables")
+        lines += [
+            "📊 Data that would be stored in Supabase:",
+            f"   • {len(all_data)} M&A deals",
+            f"   • Industries: {', '.join(industries)}",
+            f"   • Total value: ${total_value:,.0f}",
+            
+            # Show database operations that would happen
+            "\n🗄️  Database operations (simulated):",
+            "   ✅ Connected to Supabase",
+            f"   ✅ Inserted {len(all_data)} deals into 'deals' table",
+            f"   ✅ Updated {len(target_companies)} companies",
+            f"   ✅ Created {len(all_data)} news article entries",
+            "   ✅ Updated analytics tables"
+        ]
         
-        # Save to file for inspection
-        output_file = f"demo_scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w') as f:
-            json.dump({
-                'summary': {
-                    'total_duration': total_duration,
-                    'total_items': total_items,
-                    'successful_scrapers': successful_scrapers,
-                    'scraped_at': datetime.utcnow().isoformat()
-                },
-                'scraped_data': all_data
-            }, f, indent=2)
+        # Save to file for inspection: a summary line, then one line per scraped item
+        output_file = f"demo_scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        summary = {
+            'total_duration': total_duration,
+            'total_items': total_items,
+            'successful_scrapers': successful_scrapers,
+            'scraped_at': datetime.now(timezone.utc)
+        }
+        write_jsonl(output_file, itertools.chain([summary], all_data))
         
-        print(f"   💾 Demo data saved to: {output_file}")
+        lines.append(f"   💾 Demo data saved to: {output_file}")
     
-    print("\n" + "="*60)
-    print("✅ Demo completed successfully!")
-    print("\nTo run with real Supabase:")
-    print("1. Set up your Supabase project")
-    print("2. Get your project URL and service role key") 
-    print("3. Run: python parallel_scraper.py --url 'your_url' --key 'your_key'")
+    lines += [
+        "\n" + "="*60,
+        "✅ Demo completed successfully!",
+        "\nTo run with real Supabase:",
+        "1. Set up your Supabase project",
+        "2. Get your project URL and service role key",
+        "3. Run: python parallel_scraper.py --url 'your_url' --key 'your_key'"
+    ]
+    emit(*lines)
     
     return True
 
@@ -197,5 +267,8 @@ async def main():
 
 
 if __name__ == '__main__':
+    # Use the libuv event loop when available
+    install_uvloop()
+    
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
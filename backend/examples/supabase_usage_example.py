@@ -26,6 +26,7 @@ logger = logging.getLogger(__name__)
 # Import the database components
 from database.factory import create_database_adapter
 from config.supabase_config import create_supabase_config_from_env, log_supabase_config
+from config.event_loop import install_uvloop
 
 
 async def setup_supabase_adapter():
@@ -53,7 +54,7 @@ async def setup_supabase_adapter():
         return adapter
         
     except Exception as e:
-        logger.error(f"Failed to setup Supabase adapter: {e}")
+        logger.error("Failed to setup Supabase adapter: %s", e)
         raise
 
 
@@ -79,11 +80,11 @@ async def basic_crud_operations_example(adapter):
         }
         
         company_id = await adapter.create_company(company_data)
-        logger.info(f"Created company with ID: {company_id}")
+        logger.info("Created company with ID: %s", company_id)
         
         # Retrieve the company
         retrieved_company = await adapter.get_company(company_id)
-        logger.info(f"Retrieved company: {retrieved_company['name']}")
+        logger.info("Retrieved company: %s", retrieved_company['name'])
         
         # Update the company
         update_data = {
@@ -92,7 +93,7 @@ async def basic_crud_operations_example(adapter):
         }
         
         updated = await adapter.update_company(company_id, update_data)
-        logger.info(f"Company updated: {updated}")
+        logger.info("Company updated: %s", updated)
         
         # Create a sample deal
         deal_data = {
@@ -109,11 +110,11 @@ async def basic_crud_operations_example(adapter):
         }
         
         deal_id = await adapter.create_deal(deal_data)
-        logger.info(f"Created deal with ID: {deal_id}")
+        logger.info("Created deal with ID: %s", deal_id)
         
         # Retrieve the deal
         retrieved_deal = await adapter.get_deal(deal_id)
-        logger.info(f"Retrieved deal: {retrieved_deal['deal_name']}")
+        logger.info("Retrieved deal: %s", retrieved_deal['deal_name'])
         
         # Create a sample news article
         article_data = {
@@ -132,7 +133,7 @@ async def basic_crud_operations_example(adapter):
         }
         
         article_id = await adapter.create_article(article_data)
-        logger.info(f"Created article with ID: {article_id}")
+        logger.info("Created article with ID: %s", article_id)
         
         return {
             'company_id': company_id,
@@ -141,7 +142,7 @@ async def basic_crud_operations_example(adapter):
         }
         
     except Exception as e:
-        logger.error(f"Error in CRUD operations: {e}")
+        logger.error("Error in CRUD operations: %s", e)
         raise
 
 
@@ -150,6 +151,10 @@ async def bulk_operations_example(adapter):
     logger.info("=== Bulk Operations Example ===")
     
     try:
+        # Take the timestamps once for the whole batch rather than once per row
+        today = datetime.now().date()
+        now_utc = datetime.now(timezone.utc)
+        
         # Bulk insert companies
         companies_data = [
             {
@@ -163,16 +168,13 @@ async def bulk_operations_example(adapter):
             for i in range(1, 6)  # Create 5 companies
         ]
         
-        company_ids = await adapter.bulk_insert_companies(companies_data)
-        logger.info(f"Bulk inserted {len(company_ids)} companies")
-        
         # Bulk insert deals
         deals_data = [
             {
                 'deal_name': f'Deal Number {i}',
                 'deal_type': 'acquisition',
                 'deal_status': 'announced',
-                'announcement_date': datetime.now().date(),
+                'announcement_date': today,
                 'transaction_value': 50000000 * i,  # Variable deal size
                 'currency': 'USD',
                 'primary_geography': 'US'
@@ -180,9 +182,6 @@ async def bulk_operations_example(adapter):
             for i in range(1, 11)  # Create 10 deals
         ]
         
-        deal_ids = await adapter.bulk_insert_deals(deals_data)
-        logger.info(f"Bulk inserted {len(deal_ids)} deals")
-        
         # Bulk insert news articles
         articles_data = [
             {
@@ -191,15 +190,23 @@ async def bulk_operations_example(adapter):
                 'content': f'This is sample content for article {i} about M&A activity...',
                 'source_name': 'Example Financial News',
                 'source_domain': 'example-financial.com',
-                'publish_date': datetime.now(timezone.utc),
+                'publish_date': now_utc,
                 'ma_relevance_score': 0.8 + (i * 0.01),  # Variable relevance
                 'contains_deal_info': True
             }
             for i in range(1, 21)  # Create 20 articles
         ]
         
-        article_ids = await adapter.bulk_insert_articles(articles_data)
-        logger.info(f"Bulk inserted {len(article_ids)} articles")
+        # The three tables are independent, so submit all inserts concurrently;
+        # each call chunks its rows by the adapter's bulk_chunk_size
+        company_ids, deal_ids, article_ids = await asyncio.gather(
+            adapter.bulk_insert_companies(companies_data),
+            adapter.bulk_insert_deals(deals_data),
+            adapter.bulk_insert_articles(articles_data)
+        )
+        logger.info("Bulk inserted %s companies", len(company_ids))
+        logger.info("Bulk inserted %s deals", len(deal_ids))
+        logger.info("Bulk inserted %s articles", len(article_ids))
         
         return {
             'bulk_company_ids': company_ids,
@@ -208,7 +215,7 @@ async def bulk_operations_example(adapter):
         }
         
     except Exception as e:
-        logger.error(f"Error in bulk operations: {e}")
+        logger.error("Error in bulk operations: %s", e)
         raise
 
 
@@ -217,41 +224,42 @@ async def search_operations_example(adapter):
     logger.info("=== Search Operations Example ===")
     
     try:
-        # Search for deals
-        deal_results = await adapter.search_deals(
-            query='acquisition technology',
-            limit=10
-        )
-        logger.info(f"Found {len(deal_results)} deals matching 'acquisition technology'")
-        
-        # Search for companies
-        company_results = await adapter.search_companies(
-            query='Tech Company',
-            limit=5
-        )
-        logger.info(f"Found {len(company_results)} companies matching 'Tech Company'")
-        
-        # Search for articles
-        article_results = await adapter.search_articles(
-            query='M&A',
-            filters={'ma_relevance_min': 0.8},
-            limit=10
+        # The searches are independent, so run them concurrently
+        deal_results, company_results, article_results, advanced_results = await asyncio.gather(
+            # Search for deals
+            adapter.search_deals(
+                query='acquisition technology',
+                limit=10
+            ),
+            # Search for companies
+            adapter.search_companies(
+                query='Tech Company',
+                limit=5
+            ),
+            # Search for articles
+            adapter.search_articles(
+                query='M&A',
+                filters={'ma_relevance_min': 0.8},
+                limit=10
+            ),
+            # Advanced search across all tables
+            adapter.advanced_search({
+                'query': 'technology acquisition',
+                'filters': {
+                    'date_from': datetime(2024, 1, 1).date()
+                },
+                'limit_per_table': 5
+            })
         )
-        logger.info(f"Found {len(article_results)} articles matching 'M&A' with high relevance")
         
-        # Advanced search across all tables
-        advanced_results = await adapter.advanced_search({
-            'query': 'technology acquisition',
-            'filters': {
-                'date_from': datetime(2024, 1, 1).date()
-            },
-            'limit_per_table': 5
-        })
+        logger.info("Found %s deals matching 'acquisition technology'", len(deal_results))
+        logger.info("Found %s companies matching 'Tech Company'", len(company_results))
+        logger.info("Found %s articles matching 'M&A' with high relevance", len(article_results))
         
         logger.info("Advanced search results:")
-        logger.info(f"  Deals: {len(advanced_results['deals'])}")
-        logger.info(f"  Companies: {len(advanced_results['companies'])}")
-        logger.info(f"  Articles: {len(advanced_results['articles'])}")
+        logger.info("  Deals: %s", len(advanced_results['deals']))
+        logger.info("  Companies: %s", len(advanced_results['companies']))
+        logger.info("  Articles: %s", len(advanced_results['articles']))
         
         return {
             'deal_search_count': len(deal_results),
@@ -261,7 +269,7 @@ async def search_operations_example(adapter):
         }
         
     except Exception as e:
-        logger.error(f"Error in search operations: {e}")
+        logger.error("Error in search operations: %s", e)
         raise
 
 
@@ -270,32 +278,33 @@ async def analytics_example(adapter):
     logger.info("=== Analytics Example ===")
     
     try:
-        # Get deal analytics by month
-        deal_analytics = await adapter.get_deal_analytics(
-            date_from=datetime(2024, 1, 1),
-            date_to=datetime.now(),
-            group_by='month'
+        # Deal, industry and database statistics are independent queries
+        deal_analytics, industry_analytics, db_stats = await asyncio.gather(
+            # Get deal analytics by month
+            adapter.get_deal_analytics(
+                date_from=datetime(2024, 1, 1),
+                date_to=datetime.now(),
+                group_by='month'
+            ),
+            # Get industry analytics
+            adapter.get_industry_analytics(
+                date_from=datetime(2024, 1, 1)
+            ),
+            # Get database statistics
+            adapter.get_database_stats()
         )
         
         logger.info("Deal Analytics (by month):")
-        logger.info(f"  Total deals: {deal_analytics['summary']['total_deals']}")
+        logger.info("  Total deals: %s", deal_analytics['summary']['total_deals'])
         logger.info(f"  Total value: ${deal_analytics['summary']['total_value']:,.2f}")
         logger.info(f"  Average deal size: ${deal_analytics['summary']['avg_deal_size']:,.2f}")
-        logger.info(f"  Number of periods: {len(deal_analytics['trends'])}")
-        
-        # Get industry analytics
-        industry_analytics = await adapter.get_industry_analytics(
-            date_from=datetime(2024, 1, 1)
-        )
+        logger.info("  Number of periods: %s", len(deal_analytics['trends']))
         
-        logger.info(f"Industry Analytics: {len(industry_analytics['industries'])} industries analyzed")
-        
-        # Get database statistics
-        db_stats = await adapter.get_database_stats()
+        logger.info("Industry Analytics: %s industries analyzed", len(industry_analytics['industries']))
         
         logger.info("Database Statistics:")
         for table_stat in db_stats['table_stats']:
-            logger.info(f"  {table_stat['table_name']}: {table_stat['row_count']} rows")
+            logger.info("  %s: %s rows", table_stat['table_name'], table_stat['row_count'])
         
         return {
             'deal_analytics': deal_analytics,
@@ -304,7 +313,7 @@ async def analytics_example(adapter):
         }
         
     except Exception as e:
-        logger.error(f"Error in analytics: {e}")
+        logger.error("Error in analytics: %s", e)
         raise
 
 
@@ -315,46 +324,50 @@ async def realtime_subscriptions_example(adapter):
     try:
         # Define callback functions for different tables
         def deal_callback(event_data):
-            logger.info(f"Deal event: {event_data['event_type']} - {event_data['record'].get('deal_name', 'Unknown')}")
+            logger.info("Deal event: %s - %s", event_data['event_type'], event_data['record'].get('deal_name', 'Unknown'))
         
         def company_callback(event_data):
-            logger.info(f"Company event: {event_data['event_type']} - {event_data['record'].get('name', 'Unknown')}")
+            logger.info("Company event: %s - %s", event_data['event_type'], event_data['record'].get('name', 'Unknown'))
         
         def article_callback(event_data):
-            logger.info(f"Article event: {event_data['event_type']} - {event_data['record'].get('title', 'Unknown')}")
+            logger.info("Article event: %s - %s", event_data['event_type'], event_data['record'].get('title', 'Unknown'))
         
-        # Subscribe to real-time updates
-        deals_subscription = await adapter.subscribe_to_deals(deal_callback)
-        companies_subscription = await adapter.subscribe_to_companies(company_callback)
-        articles_subscription = await adapter.subscribe_to_articles(article_callback)
+        # Subscribe to real-time updates; the subscriptions are independent
+        deals_subscription, companies_subscription, articles_subscription = await asyncio.gather(
+            adapter.subscribe_to_deals(deal_callback),
+            adapter.subscribe_to_companies(company_callback),
+            adapter.subscribe_to_articles(article_callback)
+        )
         
-        logger.info(f"Created subscriptions:")
-        logger.info(f"  Deals: {deals_subscription}")
-        logger.info(f"  Companies: {companies_subscription}")
-        logger.info(f"  Articles: {articles_subscription}")
+        logger.info("Created subscriptions:")
+        logger.info("  Deals: %s", deals_subscription)
+        logger.info("  Companies: %s", companies_subscription)
+        logger.info("  Articles: %s", articles_subscription)
         
         # Subscribe with filters
         filtered_subscription = await adapter.subscribe_with_filters(
             table_name='deals',
-            callback=lambda event: logger.info(f"Filtered deal event: {event['record'].get('deal_name')}"),
+            callback=lambda event: logger.info("Filtered deal event: %s", event['record'].get('deal_name')),
             filters={'deal_status': 'announced'},
             events=['INSERT', 'UPDATE']
         )
         
-        logger.info(f"Created filtered subscription: {filtered_subscription}")
+        logger.info("Created filtered subscription: %s", filtered_subscription)
         
         # List active subscriptions
         active_subscriptions = await adapter.list_active_subscriptions()
-        logger.info(f"Active subscriptions: {len(active_subscriptions)}")
+        logger.info("Active subscriptions: %s", len(active_subscriptions))
         
         # Simulate some time for subscriptions to be active
         await asyncio.sleep(1)
         
         # Clean up subscriptions
-        await adapter._unsubscribe(deals_subscription)
-        await adapter._unsubscribe(companies_subscription)
-        await adapter._unsubscribe(articles_subscription)
-        await adapter._unsubscribe(filtered_subscription)
+        await asyncio.gather(*(
+            adapter._unsubscribe(subscription_id)
+            for subscription_id in (
+                deals_subscription, companies_subscription, articles_subscription, filtered_subscription
+            )
+        ))
         
         logger.info("Cleaned up all subscriptions")
         
@@ -364,7 +377,7 @@ async def realtime_subscriptions_example(adapter):
         }
         
     except Exception as e:
-        logger.error(f"Error in real-time subscriptions: {e}")
+        logger.error("Error in real-time subscriptions: %s", e)
         raise
 
 
@@ -373,41 +386,40 @@ async def listing_and_filtering_example(adapter):
     logger.info("=== Listing and Filtering Example ===")
     
     try:
-        # List deals with filters
-        recent_deals = await adapter.list_deals(
-            filters={
-                'deal_status': 'announced',
-                'date_from': datetime(2024, 1, 1).date()
-            },
-            limit=10,
-            sort_by='transaction_value',
-            sort_order='desc'
-        )
-        
-        logger.info(f"Found {len(recent_deals)} recent announced deals")
-        
-        # List companies with filters
-        public_companies = await adapter.list_companies(
-            filters={
-                'is_public': True,
-                'country': 'US'
-            },
-            limit=20
+        # The three listings are independent, so run them concurrently
+        recent_deals, public_companies, relevant_articles = await asyncio.gather(
+            # List deals with filters
+            adapter.list_deals(
+                filters={
+                    'deal_status': 'announced',
+                    'date_from': datetime(2024, 1, 1).date()
+                },
+                limit=10,
+                sort_by='transaction_value',
+                sort_order='desc'
+            ),
+            # List companies with filters
+            adapter.list_companies(
+                filters={
+                    'is_public': True,
+                    'country': 'US'
+                },
+                limit=20
+            ),
+            # List articles with filters
+            adapter.list_articles(
+                filters={
+                    'contains_deal_info': True,
+                    'ma_relevance_min': 0.7,
+                    'date_from': datetime(2024, 1, 1)
+                },
+                limit=15
+            )
         )
         
-        logger.info(f"Found {len(public_companies)} US public companies")
-        
-        # List articles with filters
-        relevant_articles = await adapter.list_articles(
-            filters={
-                'contains_deal_info': True,
-                'ma_relevance_min': 0.7,
-                'date_from': datetime(2024, 1, 1)
-            },
-            limit=15
-        )
-        
-        logger.info(f"Found {len(relevant_articles)} highly relevant M&A articles")
+        logger.info("Found %s recent announced deals", len(recent_deals))
+        logger.info("Found %s US public companies", len(public_companies))
+        logger.info("Found %s highly relevant M&A articles", len(relevant_articles))
         
         return {
             'recent_deals_count': len(recent_deals),
@@ -416,7 +428,7 @@ async def listing_and_filtering_example(adapter):
         }
         
     except Exception as e:
-        logger.error(f"Error in listing and filtering: {e}")
+        logger.error("Error in listing and filtering: %s", e)
         raise
 
 
@@ -449,11 +461,11 @@ async def main():
         
         # Summary
         logger.info("=== Examples Summary ===")
-        logger.info(f"All examples completed successfully!")
-        logger.info(f"Results summary: {examples_results}")
+        logger.info("All examples completed successfully!")
+        logger.info("Results summary: %s", examples_results)
         
     except Exception as e:
-        logger.error(f"Error running examples: {e}")
+        logger.error("Error running examples: %s", e)
         raise
     
     finally:
@@ -464,5 +476,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use the libuv event loop when available
+    install_uvloop()
+    
     # Run the examples
     asyncio.run(main())
\ No newline at end of file
@@ -1,14 +1,23 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import asyncio
+import orjson
 import structlog
+import time
 from contextlib import asynccontextmanager
+from typing import Optional, Tuple
 
 from api.routes import api_router
 from config.settings import settings
 from config.database import init_db
-from services.database_service import initialize_database_service, shutdown_database_service
-from services.scheduler_service import initialize_scheduler_service, shutdown_scheduler_service
+from services.database_service import (
+    get_database_service, initialize_database_service, shutdown_database_service
+)
+from services.scheduler_service import (
+    get_scheduler_service, initialize_scheduler_service, shutdown_scheduler_service
+)
 
 # Configure structured logging
 structlog.configure(
@@ -29,6 +38,8 @@ structlog.configure(
 )
 
 logger = structlog.get_logger(__name__)
+# Materialize the cached logger now rather than on the first call during startup
+logger.bind()
 
 
 @asynccontextmanager
@@ -78,6 +89,7 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -99,22 +111,62 @@ app.add_middleware(
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
+# The root payload never changes, so it is serialized once
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "message": "Welcome to MergerTracker API",
+    "docs": "/api/v1/docs",
+    "health": "/health"
+})
+
+# Serialized /health payloads are reused for this many seconds
+HEALTH_CACHE_TTL = 2.0
+_health_cache: Optional[Tuple[float, bytes]] = None
+# In-flight refresh shared by every probe that finds the cache expired
+_health_refresh: Optional[asyncio.Task] = None
+
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    global _health_refresh
+    
+    if _health_cache is not None and time.monotonic() - _health_cache[0] < HEALTH_CACHE_TTL:
+        return Response(content=_health_cache[1], media_type="application/json")
+    
+    if _health_refresh is None:
+        _health_refresh = asyncio.create_task(_refresh_health())
+    # Shielded so one disconnecting client cannot cancel the round the others await
+    body = await asyncio.shield(_health_refresh)
+    return Response(content=body, media_type="application/json")
+
+
+async def _refresh_health() -> bytes:
+    """Run one health round, caching its encoded body unless it failed"""
+    global _health_cache, _health_refresh
+    
+    try:
+        health = await _collect_health()
+        # Encode with the same options as the default ORJSONResponse
+        body = ORJSONResponse(health).body
+        if health["status"] != "unhealthy":
+            _health_cache = (time.monotonic(), body)
+        return body
+    finally:
+        _health_refresh = None
+
+
+async def _collect_health() -> dict:
+    """Gather the health payload from the database and scheduler services"""
     try:
         # Check database service
-        from services.database_service import get_database_service
         db_service = await get_database_service()
         db_health = await db_service.health_check()
         
         # Check scheduler service
-        from services.scheduler_service import get_scheduler_service
         scheduler_service = await get_scheduler_service()
         scheduler_health = {
             'status': 'healthy' if scheduler_service._running else 'stopped',
-            'active_jobs': len(await scheduler_service.list_jobs())
+            'active_jobs': scheduler_service.job_count
         }
         
         overall_status = "healthy" if (
@@ -147,11 +199,7 @@ async def health_check():
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to MergerTracker API",
-        "docs": "/api/v1/docs",
-        "health": "/health"
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -160,5 +208,7 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=settings.ENVIRONMENT == "development"
     )
\ No newline at end of file
@@ -9,15 +9,20 @@ import sys
 import os
 import logging
 import signal
+import socket
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
-import subprocess
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import asynccontextmanager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -32,6 +37,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SPIDER_TIMEOUT = 7200  # 2 hour timeout per spider
+
+# Finish reasons of crawls that ran to completion or to their item limit
+SUCCESS_FINISH_REASONS = {'finished', 'closespider_itemcount'}
+
 
 class ParallelScraper:
     """Orchestrates parallel scraping of multiple news sources"""
@@ -43,80 +53,151 @@ class ParallelScraper:
         self.results = {}
         self.start_time = None
         self.shutdown_requested = False
+        self.settings = None
+        self.runner = None
         
     def setup_environment(self):
-        """Setup environment variables for scrapers"""
+        """Setup environment variables and the shared Scrapy settings for scrapers"""
         os.environ['SUPABASE_URL'] = self.supabase_url
         os.environ['SUPABASE_SERVICE_KEY'] = self.supabase_key
         os.environ['DATABASE_ADAPTER'] = 'supabase'
         os.environ['SCRAPY_SETTINGS_MODULE'] = 'scraper.settings'
         
+        # Project settings are loaded once and copied per spider
+        from scrapy.utils.project import get_project_settings
+        self.settings = get_project_settings()
+    
+    @staticmethod
+    def install_reactor():
+        """Run the Twisted reactor on the current asyncio loop so crawls can be awaited
+        
+        The loop is already running, so the reactor is only marked as started.
+        That fires its startup triggers, which start the thread pool behind
+        deferToThread and the default name resolver.
+        """
+        if 'twisted.internet.reactor' not in sys.modules:
+            from twisted.internet import asyncioreactor
+            asyncioreactor.install(asyncio.get_running_loop())
+        
+        from twisted.internet import reactor
+        if not reactor.running:
+            reactor.startRunning(installSignalHandlers=False)
+    
+    @staticmethod
+    def stop_reactor_threads():
+        """Stop the reactor's thread pool so the process can exit
+        
+        reactor.stop() would also stop the asyncio loop we are running on.
+        """
+        from twisted.internet import reactor
+        reactor.getThreadPool().stop()
+        
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
         self.shutdown_requested = True
+        if self.runner:
+            # Spiders close normally, keeping the items scraped so far
+            self.runner.stop()
     
-    def run_spider(self, spider_name: str, max_items: int = 50, download_delay: int = 5) -> Dict[str, Any]:
-        """Run a single spider in a subprocess"""
+    def install_resolver(self):
+        """Install Scrapy's DNS_RESOLVER on the reactor, as CrawlerProcess.start() does
+        
+        CrawlerRunner leaves the reactor's default resolver in place, which
+        never consults Scrapy's DNS cache.
+        """
+        from twisted.internet import reactor
+        from scrapy.utils.misc import create_instance, load_object
+        
+        resolver_class = load_object(self.settings['DNS_RESOLVER'])
+        resolver = create_instance(resolver_class, self.settings, self.runner, reactor=reactor)
+        resolver.install_on_reactor()
+        reactor.getThreadPool().adjustPoolsize(maxthreads=self.settings.getint('REACTOR_THREADPOOL_MAXSIZE'))
+    
+    async def warm_dns_cache(self, spider_names: List[str]):
+        """Resolve the spiders' domains up front into Scrapy's process-wide DNS cache
+        
+        Every crawler in this process reads the same cache, so each host is
+        looked up once, concurrently, before any spider starts.
+        """
+        from scrapy.resolver import dnscache
+        
+        hosts = set()
+        for spider_name in spider_names:
+            for domain in getattr(self.runner.spider_loader.load(spider_name), 'allowed_domains', []):
+                hosts.update((domain, f'www.{domain}'))
+        
+        loop = asyncio.get_running_loop()
+        
+        async def resolve(host: str):
+            try:
+                addresses = await loop.getaddrinfo(host, 443, family=socket.AF_INET, type=socket.SOCK_STREAM)
+                dnscache[host] = addresses[0][4][0]
+            except OSError as e:
+                logger.warning(f"Could not pre-resolve {host}: {e}")
+        
+        await asyncio.gather(*(resolve(host) for host in hosts))
+        logger.info(f"🌐 Pre-resolved {len(hosts)} hosts")
+    
+    async def run_spider(self, spider_name: str, max_items: int = 50, download_delay: int = 5) -> Dict[str, Any]:
+        """Run a single spider in-process on the shared crawler runner"""
+        from scrapy import signals
+        from scrapy.crawler import Crawler
+        
+        spider_start = time.time()
         try:
             logger.info(f"Starting {spider_name} spider...")
             
-            cmd = [
-                'scrapy', 'crawl', spider_name,
-                '-s', f'DOWNLOAD_DELAY={download_delay}',
-                '-s', f'CLOSESPIDER_ITEMCOUNT={max_items}',
-                '-s', 'LOG_LEVEL=INFO',
-                '-s', 'FEEDS={items.json:json}',
-                '--logfile', f'{spider_name}_spider.log'
-            ]
+            # Per-spider overrides take precedence over spider custom_settings,
+            # as -s options did on the command line
+            settings = self.settings.copy()
+            settings.set('DOWNLOAD_DELAY', download_delay, priority='cmdline')
+            settings.set('CLOSESPIDER_ITEMCOUNT', max_items, priority='cmdline')
+            crawler = Crawler(self.runner.spider_loader.load(spider_name), settings)
             
-            process = subprocess.run(
-                cmd,
-                cwd=self.scraper_dir,
-                capture_output=True,
-                text=True,
-                timeout=7200  # 2 hour timeout
-            )
-            
-            # Parse results
-            items_file = self.scraper_dir / 'items.json'
+            # Count items as they leave the pipelines instead of exporting a feed file
             items_count = 0
             
-            if items_file.exists():
-                try:
-                    with open(items_file, 'r') as f:
-                        items = json.load(f)
-                        items_count = len(items) if isinstance(items, list) else 1
-                    items_file.unlink()  # Clean up
-                except Exception as e:
-                    logger.warning(f"Could not parse items file for {spider_name}: {e}")
+            def count_item(item, response, spider):
+                nonlocal items_count
+                items_count += 1
+            
+            crawler.signals.connect(count_item, signal=signals.item_scraped)
+            
+            crawl = self.runner.crawl(crawler).asFuture(asyncio.get_running_loop())
+            done, _ = await asyncio.wait({crawl}, timeout=SPIDER_TIMEOUT)
             
+            if not done:
+                logger.error(f"❌ {spider_name} timed out after 2 hours")
+                crawler.stop()
+                await crawl
+                return {
+                    'spider': spider_name,
+                    'success': False,
+                    'items_scraped': items_count,
+                    'error': 'Timeout after 2 hours',
+                    'duration': time.time() - spider_start
+                }
+            
+            crawl.result()
+            
+            finish_reason = crawler.stats.get_value('finish_reason')
+            success = finish_reason in SUCCESS_FINISH_REASONS
             result = {
                 'spider': spider_name,
-                'success': process.returncode == 0,
+                'success': success,
                 'items_scraped': items_count,
-                'stdout': process.stdout,
-                'stderr': process.stderr,
-                'return_code': process.returncode,
-                'duration': 0  # Will be calculated by caller
+                'finish_reason': finish_reason,
+                'duration': time.time() - spider_start
             }
             
-            if result['success']:
+            if success:
                 logger.info(f"✅ {spider_name} completed successfully: {items_count} items")
             else:
-                logger.error(f"❌ {spider_name} failed: {process.stderr}")
-            
+                result['error'] = f"Finished with reason: {finish_reason}"
+                logger.error(f"❌ {spider_name} finished with reason {finish_reason}: {items_count} items")
             return result
             
-        except subprocess.TimeoutExpired:
-            logger.error(f"❌ {spider_name} timed out after 2 hours")
-            return {
-                'spider': spider_name,
-                'success': False,
-                'items_scraped': 0,
-                'error': 'Timeout after 2 hours',
-                'duration': 7200
-            }
         except Exception as e:
             logger.error(f"❌ {spider_name} failed with exception: {e}")
             return {
@@ -124,20 +205,26 @@ class ParallelScraper:
                 'success': False,
                 'items_scraped': 0,
                 'error': str(e),
-                'duration': 0
+                'duration': time.time() - spider_start
             }
     
-    def run_parallel_scraping(self, max_items_per_spider: int = 25) -> Dict[str, Any]:
+    async def run_parallel_scraping(self, max_items_per_spider: int = 25) -> Dict[str, Any]:
         """Run Bloomberg and Ion Analytics scrapers in parallel"""
         self.start_time = time.time()
         
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
-        
-        # Setup environment
+        # Both spiders share one reactor, one settings load and one runner
+        self.install_reactor()
         self.setup_environment()
         
+        from scrapy.crawler import CrawlerRunner
+        self.runner = CrawlerRunner(self.settings)
+        self.install_resolver()
+        
+        # Setup signal handlers
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self.signal_handler, signum, None)
+        
         # Define spider configurations
         spiders = [
             {
@@ -156,43 +243,21 @@ class ParallelScraper:
         logger.info(f"📊 Max items per spider: {max_items_per_spider}")
         logger.info(f"🗄️ Database: Supabase")
         
-        # Run spiders in parallel using ThreadPoolExecutor
-        results = {}
-        with ThreadPoolExecutor(max_workers=len(spiders), thread_name_prefix='spider') as executor:
-            # Submit all spider jobs
-            future_to_spider = {
-                executor.submit(
-                    self.run_spider, 
-                    spider['name'], 
-                    spider['max_items'], 
-                    spider['download_delay']
-                ): spider['name'] 
-                for spider in spiders
-            }
+        try:
+            await self.warm_dns_cache([spider['name'] for spider in spiders])
             
-            # Collect results as they complete
-            for future in as_completed(future_to_spider):
-                spider_name = future_to_spider[future]
-                
-                if self.shutdown_requested:
-                    logger.info("Shutdown requested, cancelling remaining spiders...")
-                    break
-                
-                try:
-                    spider_start = time.time()
-                    result = future.result()
-                    result['duration'] = time.time() - spider_start
-                    results[spider_name] = result
-                    
-                except Exception as e:
-                    logger.error(f"Spider {spider_name} raised an exception: {e}")
-                    results[spider_name] = {
-                        'spider': spider_name,
-                        'success': False,
-                        'items_scraped': 0,
-                        'error': str(e),
-                        'duration': 0
-                    }
+            # Run spiders concurrently in this process, collecting results as they complete
+            results = {}
+            for next_result in asyncio.as_completed([
+                self.run_spider(spider['name'], spider['max_items'], spider['download_delay'])
+                for spider in spiders
+            ]):
+                result = await next_result
+                results[result['spider']] = result
+        finally:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+            self.stop_reactor_threads()
         
         # Calculate summary statistics
         total_duration = time.time() - self.start_time
@@ -280,8 +345,17 @@ class ParallelScraper:
             filename = f'scraping_results_{timestamp}.json'
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.results, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                # orjson encodes datetimes natively and writes UTF-8 bytes directly
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(
+                        self.results,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(self.results, f, indent=2, default=str)
             logger.info(f"📄 Results saved to {filename}")
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
@@ -327,7 +401,7 @@ Examples:
         
         # Run parallel scraping
         logger.info("🚀 Starting parallel scraping process...")
-        results = scraper.run_parallel_scraping(args.max_items)
+        results = await scraper.run_parallel_scraping(args.max_items)
         
         # Display and save results
         scraper.print_summary()
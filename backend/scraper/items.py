@@ -1,30 +1,53 @@
+import re
+
 import scrapy
 from itemloaders.processors import TakeFirst, MapCompose, Join
 from w3lib.html import remove_tags
 
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Line breaks, tabs and non-breaking spaces all collapse to a plain space
+WHITESPACE_TRANSLATION = str.maketrans({'\n': ' ', '\t': ' ', '\r': ' ', '\xa0': ' '})
+
+# Numbers followed by a billion/million unit, e.g. "$4.5 billion" or "300m"
+DEAL_VALUE_PATTERN = re.compile(r'[\$]?(\d+(?:\.\d+)?)\s*(billion|million|b|m)', re.IGNORECASE)
+DEAL_VALUE_MULTIPLIERS = {
+    'billion': 1000000000,
+    'b': 1000000000,
+    'million': 1000000,
+    'm': 1000000,
+}
+
 
 def clean_text(value):
     """Clean and normalize text content"""
     if value:
-        return value.strip().replace('\n', ' ').replace('\t', ' ')
+        return value.translate(WHITESPACE_TRANSLATION).strip()
     return value
 
 
+def clean_html(value):
+    """Strip markup from an HTML fragment and normalize the remaining text"""
+    if not value:
+        return value
+    if SELECTOLAX_AVAILABLE:
+        return HTMLParser(value).text(separator=' ', strip=True).translate(WHITESPACE_TRANSLATION)
+    return clean_text(remove_tags(value))
+
+
 def parse_deal_value(value):
     """Extract numeric deal value from text"""
     if not value:
         return None
     
-    import re
     # Extract numbers and units (billion, million)
-    match = re.search(r'[\$]?(\d+(?:\.\d+)?)\s*(billion|million|b|m)', value.lower())
+    match = DEAL_VALUE_PATTERN.search(value)
     if match:
-        number = float(match.group(1))
-        unit = match.group(2).lower()
-        if unit in ['billion', 'b']:
-            return number * 1000000000
-        elif unit in ['million', 'm']:
-            return number * 1000000
+        return float(match.group(1)) * DEAL_VALUE_MULTIPLIERS[match.group(2).lower()]
     return None
 
 
@@ -34,15 +57,15 @@ class NewsArticleItem(scrapy.Item):
     # Article metadata
     url = scrapy.Field(output_processor=TakeFirst())
     title = scrapy.Field(
-        input_processor=MapCompose(remove_tags, clean_text),
+        input_processor=MapCompose(clean_html),
         output_processor=TakeFirst()
     )
     content = scrapy.Field(
-        input_processor=MapCompose(remove_tags, clean_text),
+        input_processor=MapCompose(clean_html),
         output_processor=Join(' ')
     )
     summary = scrapy.Field(
-        input_processor=MapCompose(remove_tags, clean_text),
+        input_processor=MapCompose(clean_html),
         output_processor=TakeFirst()
     )
     
@@ -150,12 +173,12 @@ class RSSFeedItem(scrapy.Item):
     """RSS feed item for structured news feeds"""
     
     title = scrapy.Field(
-        input_processor=MapCompose(remove_tags, clean_text),
+        input_processor=MapCompose(clean_html),
         output_processor=TakeFirst()
     )
     link = scrapy.Field(output_processor=TakeFirst())
     description = scrapy.Field(
-        input_processor=MapCompose(remove_tags, clean_text),
+        input_processor=MapCompose(clean_html),
         output_processor=TakeFirst()
     )
     published_date = scrapy.Field(output_processor=TakeFirst())
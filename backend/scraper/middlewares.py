@@ -2,7 +2,8 @@ import random
 import logging
 from scrapy.downloadermiddlewares.useragent import UserAgentMiddleware
 from scrapy.downloadermiddlewares.httpproxy import HttpProxyMiddleware
-from scrapy.exceptions import NotConfigured
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +68,32 @@ class RateLimitMiddleware:
         return None
 
 
+class NegativeCacheMiddleware:
+    """Skip URLs that recently returned 404/410/451 instead of fetching them again"""
+    
+    NEGATIVE_STATUSES = frozenset((404, 410, 451))
+    
+    def __init__(self, ttl=3600, maxsize=50000):
+        self.dead_urls = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            ttl=crawler.settings.getint('NEGATIVE_CACHE_TTL', 3600),
+            maxsize=crawler.settings.getint('NEGATIVE_CACHE_SIZE', 50000)
+        )
+    
+    def process_request(self, request, spider):
+        if request.url in self.dead_urls:
+            raise IgnoreRequest(f"Negative-cached URL: {request.url}")
+        return None
+    
+    def process_response(self, request, response, spider):
+        if response.status in self.NEGATIVE_STATUSES:
+            self.dead_urls[request.url] = response.status
+        return response
+
+
 class RetryMiddleware:
     """Enhanced retry middleware with exponential backoff"""
     
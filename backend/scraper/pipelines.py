@@ -9,6 +9,27 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Engines shared by every spider running in this process, keyed by database URL,
+# with the number of open pipelines using each one
+_shared_engines = {}
+_engine_users = {}
+
+
+def acquire_engine(database_url):
+    """Return the process-wide pooled engine for a database URL"""
+    if database_url not in _shared_engines:
+        _shared_engines[database_url] = create_engine(database_url, pool_pre_ping=True)
+    _engine_users[database_url] = _engine_users.get(database_url, 0) + 1
+    return _shared_engines[database_url]
+
+
+def release_engine(database_url):
+    """Dispose of a shared engine once its last pipeline has closed"""
+    _engine_users[database_url] -= 1
+    if not _engine_users[database_url]:
+        del _engine_users[database_url]
+        _shared_engines.pop(database_url).dispose()
+
 
 class ValidationPipeline:
     """Pipeline to validate scraped items"""
@@ -90,7 +111,8 @@ class DatabasePipeline:
         )
     
     def open_spider(self, spider):
-        self.engine = create_engine(self.database_url)
+        # Spiders crawling in the same process share one connection pool
+        self.engine = acquire_engine(self.database_url)
         self.Session = sessionmaker(bind=self.engine)
         
         if self.redis_url:
@@ -100,7 +122,8 @@ class DatabasePipeline:
     
     def close_spider(self, spider):
         if self.engine:
-            self.engine.dispose()
+            release_engine(self.database_url)
+            self.engine = None
         logger.info(f"Database pipeline closed for spider: {spider.name}")
     
     def process_item(self, item, spider):
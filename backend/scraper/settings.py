@@ -34,6 +34,7 @@ ITEM_PIPELINES = {
 
 # Configure middlewares
 DOWNLOADER_MIDDLEWARES = {
+    'scraper.middlewares.NegativeCacheMiddleware': 350,
     'scraper.middlewares.RotateUserAgentMiddleware': 400,
     'scraper.middlewares.BloombergAntiDetectionMiddleware': 405,
     'scraper.middlewares.ProxyMiddleware': 410,
@@ -47,11 +48,20 @@ PLAYWRIGHT_LAUNCH_OPTIONS = {
     'headless': True,
 }
 
-# Cache settings
+# Cache settings: stale entries are revalidated with If-None-Match /
+# If-Modified-Since, so unchanged pages come back as bodiless 304s
 HTTPCACHE_ENABLED = True
-HTTPCACHE_EXPIRATION_SECS = 3600
+HTTPCACHE_POLICY = 'scrapy.extensions.httpcache.RFC2616Policy'
+HTTPCACHE_STORAGE = 'scrapy.extensions.httpcache.DbmCacheStorage'
+HTTPCACHE_ALWAYS_STORE = True
+HTTPCACHE_EXPIRATION_SECS = 30 * 24 * 3600
+HTTPCACHE_IGNORE_HTTP_CODES = [429, 500, 502, 503, 504]
 HTTPCACHE_DIR = 'httpcache'
 
+# URLs answering 404/410/451 are skipped for this many seconds
+NEGATIVE_CACHE_TTL = 3600
+NEGATIVE_CACHE_SIZE = 50000
+
 # Logging
 LOG_LEVEL = 'INFO'
 LOG_FILE = 'scrapy.log'
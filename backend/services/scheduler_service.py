@@ -7,6 +7,7 @@ using APScheduler for automated data collection.
 
 import logging
 import asyncio
+import uuid
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -14,13 +15,14 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.redis import RedisJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
-import subprocess
 import os
 
 from .database_service import get_database_service
 
 logger = logging.getLogger(__name__)
 
+SPIDER_TIMEOUT = 7200  # 2 hour timeout per spider
+
 
 class ScraperSchedulerService:
     """Service for scheduling and managing scraping jobs"""
@@ -206,15 +208,17 @@ class ScraperSchedulerService:
     
     async def _run_scrapy_spider(self, spider_name: str) -> Dict[str, Any]:
         """Run a Scrapy spider and return results"""
+        # Change to scraper directory
+        scraper_dir = os.path.join(os.path.dirname(__file__), '..', 'scraper')
+        # A fresh feed file per run, so overlapping runs never count each other's items
+        items_file = os.path.join(scraper_dir, f'items_{spider_name}_{uuid.uuid4().hex}.jsonl')
+        
         try:
-            # Change to scraper directory
-            scraper_dir = os.path.join(os.path.dirname(__file__), '..', 'scraper')
-            
-            # Run scrapy command
+            # Run scrapy command; -O overwrites the feed and .jsonl selects JSON lines
             cmd = [
                 'scrapy', 'crawl', spider_name,
                 '-s', 'LOG_LEVEL=INFO',
-                '-s', 'FEEDS={items.json:json}',
+                '-O', items_file,
                 '--nolog'  # Disable scrapy logging to stdout
             ]
             
@@ -226,21 +230,23 @@ class ScraperSchedulerService:
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await process.communicate()
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=SPIDER_TIMEOUT)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return {
+                    'success': False,
+                    'error': f'{spider_name} timed out after {SPIDER_TIMEOUT} seconds',
+                    'items_count': 0
+                }
             
             if process.returncode == 0:
-                # Try to count items from output file
+                # Count items from the JSON lines feed, one item per line
                 items_count = 0
-                items_file = os.path.join(scraper_dir, 'items.json')
                 if os.path.exists(items_file):
-                    import json
-                    try:
-                        with open(items_file, 'r') as f:
-                            items = json.load(f)
-                            items_count = len(items) if isinstance(items, list) else 1
-                        os.remove(items_file)  # Clean up
-                    except:
-                        pass
+                    with open(items_file, 'rb') as f:
+                        items_count = sum(1 for line in f if line.strip())
                 
                 return {
                     'success': True,
@@ -261,6 +267,12 @@ class ScraperSchedulerService:
                 'error': str(e),
                 'items_count': 0
             }
+        finally:
+            # Clean up the feed whether the run succeeded, failed or timed out
+            try:
+                os.remove(items_file)
+            except FileNotFoundError:
+                pass
     
     async def _log_scraper_run(self, spider_name: str, success: bool, items_count: int, error: str = None):
         """Log scraper run to database"""
@@ -313,7 +325,7 @@ class ScraperSchedulerService:
             
             # Generate backup filename with timestamp
             timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-            backup_path = f"/tmp/mergertracker_backup_{timestamp}.sql"
+            backup_path = f"/tmp/mergertracker_backup_{timestamp}.dump"
             
             success = await db_service.create_backup(backup_path)
             
@@ -403,6 +415,11 @@ class ScraperSchedulerService:
             logger.error(f"Error getting job status {job_id}: {e}")
             return {'error': str(e)}
     
+    @property
+    def job_count(self) -> int:
+        """Number of scheduled jobs, without building the list_jobs payload"""
+        return len(self.scheduler.get_jobs()) if self.scheduler else 0
+    
     async def list_jobs(self) -> List[Dict[str, Any]]:
         """List all scheduled jobs"""
         try:
@@ -12,6 +12,8 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from config.event_loop import install_uvloop
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -79,7 +81,7 @@ async def test_supabase_connection():
                 
                 # Test getting database stats
                 try:
-                    stats = await adapter.get_database_stats()
+                    stats = await adapter.get_database_stats(include_health=True)
                     print("✅ Database statistics retrieved")
                     print(f"📈 Connection status: {stats.get('connection_info', {}).get('connected', 'Unknown')}")
                 except Exception as e:
@@ -125,6 +127,9 @@ def main():
     if args.key:
         os.environ['SUPABASE_SERVICE_KEY'] = args.key
     
+    # Use the libuv event loop when available
+    install_uvloop()
+    
     # Run test
     success = asyncio.run(test_supabase_connection())
     return 0 if success else 1
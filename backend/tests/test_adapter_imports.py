@@ -0,0 +1,13 @@
+"""Import smoke tests for the database adapters"""
+
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize('module_name', [
+    'database.adapters.postgresql_adapter',
+    'database.adapters.supabase_adapter',
+])
+def test_adapter_module_imports(module_name):
+    importlib.import_module(module_name)
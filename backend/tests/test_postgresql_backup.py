@@ -0,0 +1,46 @@
+"""Tests for PostgreSQLAdapter.backup_data output handling"""
+
+import tempfile
+
+import pytest
+
+from database.adapters.postgresql_adapter import PostgreSQLAdapter
+
+
+def make_adapter(**config):
+    return PostgreSQLAdapter({'host': 'db.example.com', 'password': 'secret', **config})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('parallel_jobs', [1, 4])
+async def test_backup_refuses_existing_directory(tmp_path, parallel_jobs):
+    target = tmp_path / 'important'
+    target.mkdir()
+    (target / 'data.txt').write_text('keep me')
+
+    adapter = make_adapter(parallel_jobs=parallel_jobs)
+
+    assert await adapter.backup_data(str(target)) is False
+    assert (target / 'data.txt').read_text() == 'keep me'
+
+
+@pytest.mark.asyncio
+async def test_backup_refuses_existing_file(tmp_path):
+    target = tmp_path / 'backup.dump'
+    target.write_text('previous backup')
+
+    assert await make_adapter().backup_data(str(target)) is False
+    assert target.read_text() == 'previous backup'
+
+
+@pytest.mark.asyncio
+async def test_pg_service_file_only_exists_during_backup(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    existing = tmp_path / 'backup.dump'
+    existing.write_text('previous backup')
+
+    adapter = make_adapter()
+    assert not list(tmp_path.glob('*.pg_service.conf'))
+
+    await adapter.backup_data(str(existing))
+    assert not list(tmp_path.glob('*.pg_service.conf'))
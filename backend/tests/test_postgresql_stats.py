@@ -0,0 +1,42 @@
+"""Tests for PostgreSQLAdapter.get_database_stats"""
+
+import pytest
+
+from database.adapters import postgresql_adapter
+from database.adapters.postgresql_adapter import PostgreSQLAdapter
+
+
+class StubPool:
+    """Records the statements run through fetch"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def fetch(self, query, *args):
+        self.calls.append((query, args))
+        return [{'table_name': 'deals', 'row_count': 3, 'size': '16 kB'}]
+
+
+def make_adapter():
+    adapter = PostgreSQLAdapter({'host': 'db.example.com', 'database': 'mergertracker'})
+    adapter._pool = StubPool()
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_estimated_stats_read_pg_class():
+    adapter = make_adapter()
+
+    stats = await adapter.get_database_stats()
+
+    assert adapter._pool.calls == [(postgresql_adapter._STATS_SQL, (postgresql_adapter.STATS_TABLES,))]
+    assert stats['table_stats'] == [{'table_name': 'deals', 'row_count': 3, 'size': '16 kB'}]
+
+
+@pytest.mark.asyncio
+async def test_exact_stats_count_rows():
+    adapter = make_adapter()
+
+    await adapter.get_database_stats(exact=True)
+
+    assert adapter._pool.calls == [(postgresql_adapter._EXACT_STATS_SQL, ())]
@@ -0,0 +1,39 @@
+"""Tests for the SupabaseAdapter.bulk_update_deals RPC fallback"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from postgrest.exceptions import APIError
+
+from database.adapters.base import ValidationError
+from database.adapters.supabase_adapter import SupabaseAdapter
+
+
+def make_adapter(rpc_error):
+    adapter = SupabaseAdapter({
+        'url': 'https://example.supabase.co',
+        'service_key': 'service-key',
+        'key': 'anon-key',
+    })
+    adapter.client = MagicMock()
+    adapter.client.rpc.return_value.execute.side_effect = rpc_error
+    adapter.client.table.return_value.upsert.return_value.execute.return_value = SimpleNamespace(data=[])
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_missing_rpc_falls_back_to_upsert():
+    adapter = make_adapter(APIError({'code': 'PGRST202', 'message': 'function not found'}))
+
+    assert await adapter.bulk_update_deals([{'deal_id': 'd1', 'deal_status': 'completed'}]) == 1
+    adapter.client.table.return_value.upsert.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_errors_inside_rpc_are_not_retried_as_upserts():
+    adapter = make_adapter(APIError({'code': '23503', 'message': 'foreign key violation'}))
+
+    with pytest.raises(ValidationError):
+        await adapter.bulk_update_deals([{'deal_id': 'd1', 'deal_status': 'completed'}])
+    adapter.client.table.return_value.upsert.assert_not_called()
@@ -0,0 +1,22 @@
+"""Tests for the shared SupabaseAdapter HTTP client"""
+
+from types import SimpleNamespace
+
+from database.adapters.supabase_adapter import _get_client
+
+
+def test_rebuilt_postgrest_client_keeps_the_pooled_transport():
+    _get_client.cache_clear()
+    client = _get_client('https://example.supabase.co', 'header.payload.signature')
+
+    first = client.postgrest
+    assert first.session._transport is client.transport
+
+    # supabase-py drops the PostgREST client on token refresh and rebuilds it lazily
+    client._listen_to_auth_events('TOKEN_REFRESHED', SimpleNamespace(access_token='new.access.token'))
+    second = client.postgrest
+
+    assert second is not first
+    assert second.session._transport is client.transport
+    assert second.session.headers['authorization'] == 'Bearer new.access.token'
+    _get_client.cache_clear()
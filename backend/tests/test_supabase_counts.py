@@ -0,0 +1,55 @@
+"""Tests for the SupabaseAdapter row-count probes built on postgrest-py"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from postgrest import SyncPostgrestClient
+from postgrest._sync.request_builder import SyncQueryRequestBuilder
+
+from database.adapters.supabase_adapter import STATS_TABLES, SupabaseAdapter
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Adapter whose table() builds real postgrest requests and records them instead of sending"""
+    requests = []
+
+    def execute(builder):
+        requests.append(builder)
+        return SimpleNamespace(data=[], count=42)
+
+    monkeypatch.setattr(SyncQueryRequestBuilder, 'execute', execute)
+    adapter = SupabaseAdapter({
+        'url': 'https://example.supabase.co',
+        'service_key': 'service-key',
+        'key': 'anon-key',
+    })
+    adapter.client = MagicMock()
+    adapter.client.table.side_effect = SyncPostgrestClient('https://example.supabase.co/rest/v1').from_
+    adapter.client.rpc.return_value.execute.side_effect = Exception('function not found')
+    adapter.requests = requests
+    return adapter
+
+
+def assert_count_only(builder):
+    assert builder.params['limit'] == '0'
+    assert builder.headers['prefer'] == 'count=estimated'
+
+
+@pytest.mark.asyncio
+async def test_health_check_requests_count_without_rows(adapter):
+    assert await adapter.health_check() is True
+
+    [builder] = adapter.requests
+    assert_count_only(builder)
+
+
+@pytest.mark.asyncio
+async def test_table_stats_fallback_requests_counts_without_rows(adapter):
+    stats = await adapter._get_table_stats()
+
+    assert [row['table_name'] for row in stats] == STATS_TABLES
+    assert all(row['row_count'] == 42 for row in stats)
+    for builder in adapter.requests:
+        assert_count_only(builder)
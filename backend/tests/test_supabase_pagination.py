@@ -0,0 +1,58 @@
+"""Tests for SupabaseAdapter keyset ordering and pagination filters"""
+
+from postgrest import SyncPostgrestClient
+
+from database.adapters.supabase_adapter import SupabaseAdapter
+
+
+def deals_query():
+    return SyncPostgrestClient('https://example.supabase.co/rest/v1').from_('deals').select('*')
+
+
+def test_sort_and_tie_breaker_share_one_order_parameter():
+    query = SupabaseAdapter._order_keyset(deals_query(), 'created_at', True)
+    assert query.params.get_list('order') == ['created_at.desc,id.desc']
+
+    query = SupabaseAdapter._order_keyset(deals_query(), 'name', False)
+    assert query.params.get_list('order') == ['name.asc,id']
+
+
+def test_cursor_values_are_escaped():
+    query = SupabaseAdapter._apply_pagination(
+        deals_query(), 10, 0, 'name', ('Smith "&" Co\\', 'c,1'), False
+    )
+
+    assert query.params['or'] == (
+        '(name.gt."Smith \\"&\\" Co\\\\",'
+        'and(name.eq."Smith \\"&\\" Co\\\\",id.gt."c,1"),'
+        'name.is.null)'
+    )
+    assert query.params['limit'] == '10'
+
+
+def test_null_cursor_descending_continues_into_non_null_keys():
+    query = SupabaseAdapter._apply_pagination(deals_query(), 10, 0, 'created_at', (None, 'd5'), True)
+
+    assert query.params['or'] == '(and(created_at.is.null,id.lt."d5"),created_at.not.is.null)'
+
+
+def test_null_cursor_ascending_stays_within_null_keys():
+    query = SupabaseAdapter._apply_pagination(deals_query(), 10, 0, 'name', (None, 'c5'), False)
+
+    assert query.params['or'] == '(and(name.is.null,id.gt."c5"))'
+
+
+def test_sql_keyset_handles_null_cursor_keys():
+    adapter = SupabaseAdapter({
+        'url': 'https://example.supabase.co',
+        'service_key': 'service-key',
+        'key': 'anon-key',
+    })
+
+    sql, args = adapter._build_list_deals_sql(None, 10, 0, 'announced_date', 'desc', (None, 'd5'))
+    assert '((d.announced_date IS NULL AND d.id < $1) OR d.announced_date IS NOT NULL)' in sql
+    assert args == ['d5', 10, 0]
+
+    sql, args = adapter._build_list_deals_sql(None, 10, 0, 'announced_date', 'asc', ('2024-01-01', 'd5'))
+    assert '((d.announced_date, d.id) > ($1, $2) OR d.announced_date IS NULL)' in sql
+    assert args == ['2024-01-01', 'd5', 10, 0]
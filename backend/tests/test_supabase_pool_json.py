@@ -0,0 +1,86 @@
+"""Tests for JSON parameters sent over the SupabaseAdapter asyncpg pool"""
+
+import re
+from contextlib import asynccontextmanager
+
+import orjson
+import pytest
+
+from database.adapters.supabase_adapter import SupabaseAdapter
+
+
+class CodecConnection:
+    """asyncpg connection stand-in that encodes jsonb parameters with the registered codec"""
+
+    def __init__(self):
+        self.encoders = {}
+        self.queries = []
+
+    async def set_type_codec(self, type_name, *, encoder, decoder, schema):
+        self.encoders[type_name] = encoder
+
+    def _encode(self, query, args):
+        encoded = list(args)
+        for index in map(int, re.findall(r'\$(\d+)::jsonb', query)):
+            encoded[index - 1] = self.encoders['jsonb'](encoded[index - 1])
+        self.queries.append((query, encoded))
+
+    async def fetch(self, query, *args):
+        self._encode(query, args)
+        return []
+
+    async def fetchval(self, query, *args):
+        self._encode(query, args)
+        return len(orjson.loads(self.queries[-1][1][0]))
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class CodecPool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+    async def fetchval(self, query, *args):
+        return await self.conn.fetchval(query, *args)
+
+
+async def make_adapter():
+    adapter = SupabaseAdapter({
+        'url': 'https://example.supabase.co',
+        'service_key': 'service-key',
+        'key': 'anon-key',
+    })
+    conn = CodecConnection()
+    await SupabaseAdapter._init_pg_connection(conn)
+    adapter._pool = CodecPool(conn)
+    return adapter, conn
+
+
+@pytest.mark.asyncio
+async def test_upsert_rows_encode_as_json_array():
+    adapter, conn = await make_adapter()
+    rows = [{'id': 'c1', 'name': 'Acme'}, {'id': 'c2', 'name': 'Globex'}]
+
+    await adapter._upsert_rows_sql('companies', rows, ['id'])
+
+    [(query, [param])] = conn.queries
+    assert 'jsonb_populate_recordset' in query
+    assert orjson.loads(param) == rows
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_batch_encodes_as_json_array():
+    adapter, conn = await make_adapter()
+    updates = [{'deal_id': 'd1', 'deal_status': 'completed'}, {'deal_id': 'd2', 'deal_status': 'pending'}]
+
+    assert await adapter.bulk_update_deals(updates) == 2
+
+    [(query, [param])] = conn.queries
+    assert query == 'SELECT bulk_update_deals($1::jsonb)'
+    assert [row['deal_id'] for row in orjson.loads(param)] == ['d1', 'd2']
@@ -0,0 +1,149 @@
+"""Tests for the SupabaseAdapter single-record read cache"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cachetools import TTLCache
+
+from database.adapters.supabase_adapter import SupabaseAdapter
+
+
+def make_adapter(**config):
+    adapter = SupabaseAdapter({
+        'url': 'https://example.supabase.co',
+        'service_key': 'service-key',
+        'key': 'anon-key',
+        **config
+    })
+    adapter.client = MagicMock()
+    return adapter
+
+
+def stub_select(adapter, rows):
+    """Point the deals/companies select chain at the given rows"""
+    execute = adapter.client.table.return_value.select.return_value.eq.return_value.execute
+    execute.return_value = SimpleNamespace(data=rows)
+    return execute
+
+
+def test_cache_settings_come_from_connection_config():
+    adapter = make_adapter(read_cache_size=5, read_cache_ttl=7)
+
+    assert adapter._read_cache.maxsize == 5
+    assert adapter._read_cache.ttl == 7
+
+
+@pytest.mark.asyncio
+async def test_get_deal_is_served_from_cache():
+    adapter = make_adapter()
+    execute = stub_select(adapter, [{'deal_id': 'd1', 'deal_value': 10}])
+
+    first = await adapter.get_deal('d1')
+    second = await adapter.get_deal('d1')
+
+    assert first == second == {'deal_id': 'd1', 'deal_value': 10}
+    assert execute.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_records_are_returned_as_copies():
+    adapter = make_adapter()
+    stub_select(adapter, [{'id': 'c1', 'name': 'Acme'}])
+
+    first = await adapter.get_company('c1')
+    first['name'] = 'Mutated'
+    second = await adapter.get_company('c1')
+    second['name'] = 'Mutated again'
+
+    assert (await adapter.get_company('c1'))['name'] == 'Acme'
+
+
+@pytest.mark.asyncio
+async def test_delete_deal_invalidates_cache():
+    adapter = make_adapter()
+    execute = stub_select(adapter, [{'deal_id': 'd1'}])
+
+    await adapter.get_deal('d1')
+    await adapter.delete_deal('d1')
+    await adapter.get_deal('d1')
+
+    assert execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_invalidates_on_deal_id():
+    adapter = make_adapter()
+    execute = stub_select(adapter, [{'deal_id': 'd1'}])
+    delete = adapter.client.table.return_value.delete.return_value.in_.return_value.execute
+    delete.return_value = SimpleNamespace(data=[{'deal_id': 'd1'}])
+
+    await adapter.get_deal('d1')
+    assert await adapter.bulk_delete_records('deals', ['d1'], id_column='deal_id') == 1
+    await adapter.get_deal('d1')
+
+    assert execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_on_other_column_drops_table_entries():
+    adapter = make_adapter()
+    execute = stub_select(adapter, [{'deal_id': 'd1'}])
+    delete = adapter.client.table.return_value.delete.return_value.in_.return_value.execute
+    delete.return_value = SimpleNamespace(data=[{'id': 42}])
+
+    await adapter.get_deal('d1')
+    await adapter.bulk_delete_records('deals', ['42'])
+    await adapter.get_deal('d1')
+
+    assert execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_records_expire():
+    adapter = make_adapter()
+    now = [0.0]
+    adapter._read_cache = TTLCache(maxsize=10, ttl=60, timer=lambda: now[0])
+    execute = stub_select(adapter, [{'deal_id': 'd1'}])
+
+    await adapter.get_deal('d1')
+    now[0] = 30.0
+    await adapter.get_deal('d1')
+    assert execute.call_count == 1
+
+    now[0] = 61.0
+    await adapter.get_deal('d1')
+    assert execute.call_count == 2
+
+
+class ExpiredBetweenLookups(dict):
+    """Cache whose entry expires right after a membership test succeeds"""
+
+    def __contains__(self, key):
+        return True
+
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+
+@pytest.mark.asyncio
+async def test_entry_expiring_during_lookup_is_a_miss():
+    adapter = make_adapter()
+    adapter._read_cache = ExpiredBetweenLookups()
+    execute = stub_select(adapter, [{'deal_id': 'd1'}])
+
+    assert (await adapter.get_deal('d1'))['deal_id'] == 'd1'
+    assert execute.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_companies_invalidates_cache():
+    adapter = make_adapter()
+    execute = stub_select(adapter, [{'id': 'c1', 'name': 'Acme'}])
+    adapter._upsert_in_chunks = AsyncMock(return_value=[SimpleNamespace(data=[{'id': 'c1'}])])
+
+    await adapter.get_company('c1')
+    assert await adapter.bulk_insert_companies([{'name': 'Acme Corp', 'cusip': '123'}]) == ['c1']
+    await adapter.get_company('c1')
+
+    assert execute.call_count == 2
@@ -0,0 +1,63 @@
+"""Tests for the SupabaseAdapter search_tsv / ILIKE text search fallback"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from postgrest import SyncPostgrestClient
+from postgrest._sync.request_builder import SyncQueryRequestBuilder
+from postgrest.exceptions import APIError
+
+from database.adapters.base import DatabaseError
+from database.adapters.supabase_adapter import SupabaseAdapter
+
+
+def make_adapter(monkeypatch, tsv_error=None):
+    """Adapter whose table() builds real postgrest requests; the search_tsv request may fail"""
+    requests = []
+
+    def execute(builder):
+        requests.append(builder)
+        if tsv_error and 'search_tsv' in builder.params:
+            raise tsv_error
+        return SimpleNamespace(data=[{'id': 'c1'}], count=None)
+
+    monkeypatch.setattr(SyncQueryRequestBuilder, 'execute', execute)
+    adapter = SupabaseAdapter({
+        'url': 'https://example.supabase.co',
+        'service_key': 'service-key',
+        'key': 'anon-key',
+    })
+    adapter.client = MagicMock()
+    adapter.client.table.side_effect = SyncPostgrestClient('https://example.supabase.co/rest/v1').from_
+    return adapter, requests
+
+
+@pytest.mark.asyncio
+async def test_search_uses_websearch_tsquery(monkeypatch):
+    adapter, requests = make_adapter(monkeypatch)
+
+    assert await adapter._fallback_text_search('companies', 'acme corp') == [{'id': 'c1'}]
+
+    [builder] = requests
+    assert builder.params['search_tsv'] == 'wfts(english).acme corp'
+
+
+@pytest.mark.asyncio
+async def test_missing_search_tsv_column_falls_back_to_ilike(monkeypatch):
+    error = APIError({'code': '42703', 'message': 'column companies.search_tsv does not exist'})
+    adapter, requests = make_adapter(monkeypatch, tsv_error=error)
+
+    assert await adapter._fallback_text_search('companies', 'acme') == [{'id': 'c1'}]
+
+    assert requests[-1].params['or'] == '(name.ilike.%acme%,description.ilike.%acme%)'
+
+
+@pytest.mark.asyncio
+async def test_other_search_errors_are_not_masked(monkeypatch):
+    error = APIError({'code': '57014', 'message': 'canceling statement due to statement timeout'})
+    adapter, requests = make_adapter(monkeypatch, tsv_error=error)
+
+    with pytest.raises(DatabaseError):
+        await adapter._fallback_text_search('companies', 'acme')
+    assert len(requests) == 1
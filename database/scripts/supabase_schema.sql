@@ -374,7 +374,16 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_publish_relevance ON news_artic
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_source_date ON news_articles(source_domain, publish_date);
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_processed_review ON news_articles(is_processed, requires_review);
 
+-- Stored search vectors so text search is a single GIN index probe
+ALTER TABLE deals ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', deal_name || ' ' || COALESCE(deal_description, ''))) STORED;
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', name || ' ' || COALESCE(description, ''))) STORED;
+
 -- Full-text search indexes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deals_search_tsv ON deals USING gin(search_tsv);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_search_tsv ON companies USING gin(search_tsv);
+
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_name_fts ON companies USING gin(to_tsvector('english', name));
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_description_fts ON companies USING gin(to_tsvector('english', COALESCE(description, '')));
 
@@ -537,11 +546,11 @@ BEGIN
         d.transaction_value,
         d.announcement_date,
         ts_rank(
-            to_tsvector('english', d.deal_name || ' ' || COALESCE(d.deal_description, '')),
+            d.search_tsv,
             plainto_tsquery('english', search_text)
         ) as rank
     FROM deals d
-    WHERE to_tsvector('english', d.deal_name || ' ' || COALESCE(d.deal_description, ''))
+    WHERE d.search_tsv
           @@ plainto_tsquery('english', search_text)
     ORDER BY rank DESC
     LIMIT max_results;
@@ -569,17 +578,74 @@ BEGIN
         c.country,
         c.market_cap,
         ts_rank(
-            to_tsvector('english', c.name || ' ' || COALESCE(c.description, '')),
+            c.search_tsv,
             plainto_tsquery('english', search_text)
         ) as rank
     FROM companies c
-    WHERE to_tsvector('english', c.name || ' ' || COALESCE(c.description, ''))
+    WHERE c.search_tsv
           @@ plainto_tsquery('english', search_text)
     ORDER BY rank DESC
     LIMIT max_results;
 END;
 $$;
 
+-- Function to search deals, companies and articles in a single round trip
+CREATE OR REPLACE FUNCTION search_all(q TEXT, lim INTEGER DEFAULT 25)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    WITH query AS (
+        SELECT plainto_tsquery('english', q) AS tsq
+    )
+    SELECT jsonb_build_object(
+        'deals', COALESCE((
+            SELECT jsonb_agg(to_jsonb(d) - 'rank' ORDER BY d.rank DESC)
+            FROM (
+                SELECT 
+                    d.id,
+                    d.deal_id,
+                    d.deal_name,
+                    d.deal_type,
+                    d.deal_status,
+                    d.transaction_value,
+                    d.announcement_date,
+                    ts_rank(d.search_tsv, query.tsq) AS rank
+                FROM deals d, query
+                WHERE d.search_tsv @@ query.tsq
+                ORDER BY rank DESC
+                LIMIT lim
+            ) d
+        ), '[]'::jsonb),
+        'companies', COALESCE((
+            SELECT jsonb_agg(to_jsonb(c) - 'rank' ORDER BY c.rank DESC)
+            FROM (
+                SELECT 
+                    c.id,
+                    c.name,
+                    c.ticker_symbol,
+                    c.country,
+                    c.market_cap,
+                    ts_rank(c.search_tsv, query.tsq) AS rank
+                FROM companies c, query
+                WHERE c.search_tsv @@ query.tsq
+                ORDER BY rank DESC
+                LIMIT lim
+            ) c
+        ), '[]'::jsonb),
+        'articles', COALESCE((
+            SELECT jsonb_agg(to_jsonb(n) ORDER BY n.ma_relevance_score DESC NULLS LAST)
+            FROM (
+                SELECT n.*
+                FROM news_articles n, query
+                WHERE to_tsvector('english', n.title) @@ query.tsq
+                ORDER BY n.ma_relevance_score DESC NULLS LAST
+                LIMIT lim
+            ) n
+        ), '[]'::jsonb)
+    )
+$$;
+
 -- Function to get deal analytics
 CREATE OR REPLACE FUNCTION get_deal_analytics(
     date_from DATE DEFAULT NULL,
@@ -627,6 +693,106 @@ BEGIN
 END;
 $$;
 
+-- Function to get planner row estimates for tables (O(1), no sequential scans)
+CREATE OR REPLACE FUNCTION get_table_stats(table_names TEXT[] DEFAULT ARRAY['deals', 'companies', 'news_articles'])
+RETURNS TABLE (
+    table_name TEXT,
+    row_count BIGINT,
+    size TEXT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT 
+        c.relname::TEXT,
+        GREATEST(c.reltuples, 0)::BIGINT,
+        pg_size_pretty(pg_total_relation_size(c.oid))
+    FROM pg_class c
+    WHERE c.relname = ANY(table_names)
+    AND c.relkind = 'r'
+    AND c.relnamespace = 'public'::regnamespace
+    ORDER BY array_position(table_names, c.relname::TEXT)
+$$;
+
+-- Function to look up an article by article_id or URL using the unique indexes
+CREATE OR REPLACE FUNCTION get_article_by_id_or_url(v TEXT)
+RETURNS SETOF news_articles
+LANGUAGE sql
+STABLE
+AS $$
+    (
+        SELECT * FROM news_articles
+        WHERE article_id = CASE
+            WHEN v ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' THEN v::UUID
+        END
+        UNION ALL
+        SELECT * FROM news_articles
+        WHERE url = v
+    )
+    LIMIT 1
+$$;
+
+-- Function to apply partial updates to many deals in a single statement
+-- (keys missing from an update keep their current values)
+CREATE OR REPLACE FUNCTION bulk_update_deals(payload JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    column_list TEXT;
+    updated_count INTEGER;
+BEGIN
+    SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position)
+    INTO column_list
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+    AND table_name = 'deals'
+    AND column_name NOT IN ('id', 'deal_id', 'created_at', 'updated_at')
+    AND is_generated = 'NEVER';
+
+    EXECUTE format('
+        UPDATE deals d
+        SET (%1$s) = (SELECT %1$s FROM jsonb_populate_record(d, v.item)),
+            updated_at = NOW()
+        FROM jsonb_array_elements($1) AS v(item)
+        WHERE d.deal_id = (v.item->>''deal_id'')::UUID
+    ', column_list)
+    USING payload;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+-- Function to get industry-wise deal analytics
+CREATE OR REPLACE FUNCTION get_industry_analytics(
+    date_from DATE DEFAULT NULL,
+    date_to DATE DEFAULT NULL
+)
+RETURNS TABLE (
+    industry_sic VARCHAR(4),
+    industry TEXT,
+    deal_count BIGINT,
+    total_value NUMERIC,
+    avg_value NUMERIC
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT 
+        d.primary_industry_sic,
+        COALESCE(MAX(ic.sic_description), 'Unknown'),
+        COUNT(*)::BIGINT,
+        COALESCE(SUM(d.transaction_value), 0),
+        COALESCE(SUM(d.transaction_value), 0) / COUNT(*)
+    FROM deals d
+    LEFT JOIN industry_classifications ic ON ic.sic_code = d.primary_industry_sic
+    WHERE (date_from IS NULL OR d.announcement_date >= date_from)
+    AND (date_to IS NULL OR d.announcement_date <= date_to)
+    GROUP BY d.primary_industry_sic
+    ORDER BY 3 DESC
+$$;
+
 -- Create API key authentication function
 CREATE OR REPLACE FUNCTION authenticate_api_key(api_key UUID)
 RETURNS UUID